@@ -1,24 +1,514 @@
+import math
+import os
+import tempfile
+from bisect import bisect_left, insort
+from collections import namedtuple
+from time import perf_counter
 import numpy as np
 
-def generar_datos(n):
-    listaDatos = np.random.randint(1, n+1, size=n)
+# Formatos de memoryview que se pueden recorrer e indexar directamente
+FORMATOS_NATIVOS = set('bBhHiIlLqQfd')
+DISTRIBUCIONES = ('uniforme', 'sesgada', 'agrupada')
+# Copia ordenada en orden BFS: arbol[1] es la raiz y los hijos de k son 2k y 2k+1
+Eytzinger = namedtuple('Eytzinger', 'arbol n altura')
+GRUPOS = 10  # Número de grupos de la distribución agrupada
+BLOQUE = 1 << 20  # Elementos por bloque al generar o recorrer datos grandes
+BLOQUE_VECTORIZADO = 1 << 16  # Elementos comparados a la vez en la búsqueda lineal vectorizada
+TASA_FALSOS_POSITIVOS = 0.01  # Tasa por defecto del filtro de Bloom
+MASCARA_64 = (1 << 64) - 1
+CARGA = 1000  # Elementos por bloque de ListaOrdenada, un bloque se divide al pasar de 2*CARGA
+# Datos junto con su filtro de Bloom, ver construir_filtro_bloom
+DatosConFiltro = namedtuple('DatosConFiltro', 'datos filtro')
+# Valores distintos ordenados y la primera posicion de cada uno en los datos originales
+IndicePertenencia = namedtuple('IndicePertenencia', 'valores primeras')
+
+def generar_datos(n, distribucion='uniforme', rng=None):
+    # Enteros en [1, n] con distintas distribuciones:
+    #   uniforme: todos los valores igual de probables (caso ideal de interpolación)
+    #   sesgada: distribución zipf, la mayoría de los valores son pequeños
+    #   agrupada: valores concentrados alrededor de unos cuantos centros
+    # rng es un np.random.Generator opcional para obtener datos reproducibles
+    if rng is None:
+        rng = np.random.default_rng()
+    centros = rng.integers(1, n+1, size=GRUPOS) if distribucion == 'agrupada' else None
+    return generar_valores(n, n, distribucion, rng, centros)
+
+def generar_valores(tamanio, maximo, distribucion, rng, centros=None):
+    # tamanio enteros en [1, maximo]; centros son los de la distribución agrupada
+    if distribucion == 'uniforme':
+        listaDatos = rng.integers(1, maximo+1, size=tamanio, dtype=np.int64)
+    elif distribucion == 'sesgada':
+        listaDatos = np.minimum(rng.zipf(1.5, size=tamanio), maximo).astype(np.int64)
+    elif distribucion == 'agrupada':
+        listaDatos = (centros[rng.integers(0, len(centros), size=tamanio)]
+                      + rng.normal(0, max(maximo/1000, 1), size=tamanio))
+        listaDatos = np.clip(np.rint(listaDatos), 1, maximo).astype(np.int64)
+    else:
+        raise ValueError(f'Distribucion desconocida: {distribucion}')
     return listaDatos
 
-def busqueda_lineal(lista, x):
-    for elemento in lista:
-        if elemento == x:
-            return True
-    return False
+def generar_datos_archivo(ruta, n, distribucion='uniforme', rng=None, ordenado=False, bloque=BLOQUE):
+    # Escribe n enteros en [1, n] a un archivo .npy bloque por bloque, sin tener
+    # todo el arreglo en memoria. Regresa los datos abiertos con abrir_datos.
+    # Con ordenado=True (solo distribución uniforme) los valores salen ya ordenados:
+    # se reparte n entre rangos de valores con una multinomial y cada rango se ordena por separado.
+    # Se escribe a un archivo temporal que reemplaza a ruta solo al terminar, así
+    # una generación interrumpida nunca deja un archivo incompleto con ese nombre
+    if distribucion not in DISTRIBUCIONES:
+        raise ValueError(f'Distribucion desconocida: {distribucion}')
+    if ordenado and distribucion != 'uniforme':
+        raise ValueError('Solo se pueden generar datos ordenados con distribucion uniforme')
+    if rng is None:
+        rng = np.random.default_rng()
+    descriptor, temporal = tempfile.mkstemp(suffix='.npy', dir=os.path.dirname(os.path.abspath(ruta)))
+    os.close(descriptor)
+    try:
+        datos = np.lib.format.open_memmap(temporal, mode='w+', dtype=np.int64, shape=(n,))
+        if ordenado:
+            rangos = max(1, n // bloque)
+            limites = np.linspace(1, n+1, rangos+1).astype(np.int64)
+            cantidades = rng.multinomial(n, np.diff(limites) / n)
+            inicio = 0
+            for desde, hasta, cantidad in zip(limites[:-1], limites[1:], cantidades):
+                datos[inicio:inicio+cantidad] = np.sort(rng.integers(desde, hasta, size=cantidad, dtype=np.int64))
+                inicio += cantidad
+        else:
+            centros = rng.integers(1, n+1, size=GRUPOS) if distribucion == 'agrupada' else None
+            for inicio in range(0, n, bloque):
+                fin = min(inicio+bloque, n)
+                datos[inicio:fin] = generar_valores(fin-inicio, n, distribucion, rng, centros)
+        datos.flush()
+        del datos
+        os.replace(temporal, ruta)
+    except BaseException:
+        os.remove(temporal)
+        raise
+    return abrir_datos(ruta)
 
-def busqueda_binaria(lista, x):
-    lista.sort()
-    izquierda = 0
-    derecha = len(lista)-1
+def datos_completos(datos, n):
+    # Un archivo reutilizable tiene n enteros int64 en [1, n]; los valores se
+    # escriben en orden, así que un cero al final delata una generación a medias
+    return datos.shape == (n,) and datos.dtype == np.int64 and (n == 0 or datos[-1] != 0)
+
+def abrir_datos(ruta):
+    # Abre un .npy como np.memmap de solo lectura: las paginas se leen del disco
+    # solo cuando se tocan
+    return np.load(ruta, mmap_mode='r')
+
+def vista(lista):
+    # Vista sin copia para datos con protocolo de buffer (ndarray, array('q'), ...).
+    # Recorrer un memoryview produce int de Python en lugar de un np.int64 por elemento
+    try:
+        datos = memoryview(lista)
+    except TypeError:
+        return lista
+    if datos.ndim != 1 or datos.format not in FORMATOS_NATIVOS:
+        return lista
+    return datos
+
+def ordenar_datos(lista):
+    # Copia ordenada, la lista original no se modifica
+    return np.sort(np.asarray(lista))
+
+class Indice:
+    # Estructura auxiliar que se construye una sola vez por conjunto de datos.
+    # Se reconstruye solo cuando cambia la generacion de los datos.
+    def __init__(self, construir):
+        self.construir = construir
+        self.generacion = None
+        self.datos = None
+        self.tiempo_construccion = 0.0
+
+    def obtener(self, lista, generacion):
+        # Regresa (datos_del_indice, construido) donde construido indica si se
+        # tuvo que pagar el costo de construccion en esta llamada
+        if self.datos is not None and generacion == self.generacion:
+            return self.datos, False
+        # Liberar la estructura anterior si tiene recursos del sistema
+        if hasattr(self.datos, 'cerrar'):
+            self.datos.cerrar()
+        inicio = perf_counter()
+        self.datos = self.construir(lista)
+        self.tiempo_construccion = perf_counter() - inicio
+        self.generacion = generacion
+        return self.datos, True
+
+# Todas las busquedas regresan la posicion de x o -1 si no se encuentra.
+# Las busquedas sobre datos ordenados regresan la posicion en la copia ordenada
+
+def busqueda_lineal(lista, x, bloque=BLOQUE):
+    # Recorre los datos en bloques de tamaño fijo; con un np.memmap solo se
+    # leen del disco las paginas del bloque actual
+    lista = vista(lista)
+    if isinstance(lista, memoryview):
+        # Las rebanadas de un memoryview no copian los datos
+        bloques = ((inicio, lista[inicio:inicio+bloque]) for inicio in range(0, len(lista), bloque))
+    else:
+        bloques = ((0, lista),)
+    for inicio, elementos in bloques:
+        for posicion, elemento in enumerate(elementos, inicio):
+            if elemento == x:
+                return posicion
+    return -1
+
+def busqueda_lineal_vectorizada(lista, x, bloque=BLOQUE_VECTORIZADO):
+    # Mismo recorrido O(n) que busqueda_lineal pero cada bloque se compara con
+    # NumPy, sin crear un entero de Python por elemento; se detiene en el primer
+    # bloque que contiene x
+    datos = np.asarray(lista)
+    for inicio in range(0, len(datos), bloque):
+        posiciones = np.flatnonzero(datos[inicio:inicio+bloque] == x)
+        if posiciones.size:
+            return inicio + int(posiciones[0])
+    return -1
+
+def busqueda_binaria(lista, x, izquierda=0, derecha=None):
+    # La lista debe estar ordenada (ver ordenar_datos / Indice)
+    lista = vista(lista)
+    if derecha is None:
+        derecha = len(lista)-1
     while izquierda <= derecha:
         medio = (izquierda+derecha)//2
         if lista[medio] == x:
-            return True
+            return medio
         elif lista[medio] > x:
             derecha = medio-1
         else: izquierda = medio+1
-    return False
+    return -1
+
+def limite_inferior(lista, x):
+    # Primera posicion de la lista ordenada con valor >= x
+    lista = vista(lista)
+    izquierda = 0
+    derecha = len(lista)
+    while izquierda < derecha:
+        medio = (izquierda+derecha)//2
+        if lista[medio] < x:
+            izquierda = medio+1
+        else: derecha = medio
+    return izquierda
+
+def limite_superior(lista, x):
+    # Primera posicion de la lista ordenada con valor > x
+    lista = vista(lista)
+    izquierda = 0
+    derecha = len(lista)
+    while izquierda < derecha:
+        medio = (izquierda+derecha)//2
+        if lista[medio] <= x:
+            izquierda = medio+1
+        else: derecha = medio
+    return izquierda
+
+def rango_igual(lista, x):
+    # Rango [inicio, fin) con todas las apariciones de x en la lista ordenada,
+    # fin - inicio es el numero de apariciones. O(log n)
+    return limite_inferior(lista, x), limite_superior(lista, x)
+
+def busqueda_interpolacion(lista, x):
+    # Sobre una lista ordenada estima la posicion de x suponiendo valores
+    # uniformes: O(log log n) en promedio, O(n) con datos sesgados
+    lista = vista(lista)
+    izquierda = 0
+    derecha = len(lista)-1
+    while izquierda <= derecha and lista[izquierda] <= x <= lista[derecha]:
+        if lista[derecha] == lista[izquierda]:
+            return izquierda if lista[izquierda] == x else -1
+        medio = izquierda + int((x-lista[izquierda]) * (derecha-izquierda) // (lista[derecha]-lista[izquierda]))
+        if lista[medio] == x:
+            return medio
+        elif lista[medio] > x:
+            derecha = medio-1
+        else: izquierda = medio+1
+    return -1
+
+def busqueda_exponencial(lista, x):
+    # Sobre una lista ordenada duplica el limite hasta rebasar x y despues
+    # hace busqueda binaria en ese rango: O(log i) con i la posicion de x
+    lista = vista(lista)
+    n = len(lista)
+    if n == 0:
+        return -1
+    limite = 1
+    while limite < n and lista[limite] < x:
+        limite *= 2
+    return busqueda_binaria(lista, x, limite//2, min(limite, n-1))
+
+def construir_eytzinger(lista):
+    # Acomoda la copia ordenada en orden BFS (Eytzinger) sobre un arbol completo de
+    # 2^altura - 1 nodos. Los primeros niveles quedan juntos en memoria, asi las
+    # busquedas repetidas aprovechan mejor el cache que la busqueda binaria clasica.
+    # Los nodos sobrantes se rellenan con el valor maximo para quedar al final del recorrido
+    ordenados = ordenar_datos(lista)
+    n = len(ordenados)
+    altura = max(n.bit_length(), 1)
+    relleno = np.iinfo(ordenados.dtype).max if ordenados.dtype.kind in 'iu' else np.inf
+    arbol = np.empty(1 << altura, dtype=ordenados.dtype)
+    arbol[0] = relleno
+    # El nodo j del nivel d es el elemento (2j+1)*2^(altura-1-d) - 1 del recorrido en orden
+    for nivel in range(altura):
+        posiciones = (2*np.arange(1 << nivel, dtype=np.int64) + 1) * (1 << (altura-1-nivel)) - 1
+        validas = posiciones < n
+        nodos = arbol[1 << nivel:2 << nivel]
+        nodos[:] = relleno
+        nodos[validas] = ordenados[posiciones[validas]]
+    return Eytzinger(arbol, n, altura)
+
+def busqueda_eytzinger(eytzinger, x):
+    # Baja siempre altura niveles sin salir antes (ciclo sin ramas que dependan de x)
+    # y despues regresa al ultimo nodo donde se bajo a la izquierda: el limite inferior.
+    # Regresa la posicion en la copia ordenada o -1
+    arbol = vista(eytzinger.arbol)
+    k = 1
+    for _ in range(eytzinger.altura):
+        k = 2*k + (arbol[k] < x)
+    # Quitar los pasos a la derecha finales y uno mas
+    k >>= ((~k) & (k+1)).bit_length()
+    if k == 0 or arbol[k] != x:
+        return -1
+    nivel = k.bit_length() - 1
+    posicion = (2*(k - (1 << nivel)) + 1) * (1 << (eytzinger.altura-1-nivel)) - 1
+    return posicion if posicion < eytzinger.n else -1
+
+def busqueda_eytzinger_lote(eytzinger, claves):
+    # Misma busqueda que busqueda_eytzinger para todas las claves a la vez.
+    # Regresa (encontrados, posiciones) con posicion -1 si la clave no esta
+    arbol = eytzinger.arbol
+    claves = np.asarray(claves)
+    k = np.ones(len(claves), dtype=np.int64)
+    for _ in range(eytzinger.altura):
+        k = 2*k + (arbol[k] < claves)
+    # frexp da el exponente exacto: bit_length de cada entero
+    k >>= np.frexp((~k) & (k+1))[1]
+    nivel = np.maximum(np.frexp(k)[1] - 1, 0)
+    posiciones = (2*(k - (1 << nivel)) + 1) * (1 << (eytzinger.altura-1-nivel)) - 1
+    encontrados = (k > 0) & (arbol[k] == claves) & (posiciones < eytzinger.n)
+    return encontrados, np.where(encontrados, posiciones, -1)
+
+def construir_indice_hash(lista):
+    # Diccionario valor -> primera posicion. Se recorre de atras hacia adelante
+    # para que la primera aparicion sobrescriba a las siguientes
+    valores = lista.tolist() if isinstance(lista, np.ndarray) else list(lista)
+    return dict(zip(reversed(valores), range(len(valores)-1, -1, -1)))
+
+def busqueda_hash(indice, x):
+    # Consulta O(1) sobre el indice de construir_indice_hash
+    return indice.get(x, -1)
+
+def mezclar(x):
+    # Funcion de mezcla de splitmix64 sobre enteros de 64 bits
+    x = (x + 0x9E3779B97F4A7C15) & MASCARA_64
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & MASCARA_64
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & MASCARA_64
+    return x ^ (x >> 31)
+
+def mezclar_arreglo(x):
+    # La misma mezcla para un arreglo uint64, la aritmetica de NumPy ya es modulo 2^64
+    x = x + np.uint64(0x9E3779B97F4A7C15)
+    x = (x ^ (x >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    x = (x ^ (x >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return x ^ (x >> np.uint64(31))
+
+class FiltroBloom:
+    # Conjunto aproximado: contiene(x) puede dar falsos positivos pero nunca falsos
+    # negativos, asi que un False descarta x en O(k) sin recorrer los datos.
+    # Los bits se guardan en un arreglo uint8 y las k posiciones de cada valor
+    # salen de dos mezclas (h1 + i*h2)
+    def __init__(self, capacidad, tasa_falsos_positivos=TASA_FALSOS_POSITIVOS):
+        if not 0 < tasa_falsos_positivos < 1:
+            raise ValueError(f'La tasa de falsos positivos debe estar entre 0 y 1: {tasa_falsos_positivos}')
+        capacidad = max(capacidad, 1)
+        self.num_bits = max(8, math.ceil(-capacidad * math.log(tasa_falsos_positivos) / math.log(2)**2))
+        self.num_funciones = max(1, round(self.num_bits / capacidad * math.log(2)))
+        self.bits = np.zeros((self.num_bits + 7) // 8, dtype=np.uint8)
+        # Contadores de uso
+        self.consultas = 0
+        self.descartes = 0
+        self.falsos_positivos = 0
+
+    def posiciones(self, x):
+        # int() para aceptar escalares de NumPy como las demas busquedas
+        x = int(x) & MASCARA_64
+        h1 = mezclar(x)
+        h2 = mezclar(x ^ 0x5851F42D4C957F2D) | 1
+        return [((h1 + i*h2) & MASCARA_64) % self.num_bits for i in range(self.num_funciones)]
+
+    def posiciones_lote(self, valores):
+        valores = np.asarray(valores).astype(np.uint64)
+        h1 = mezclar_arreglo(valores)
+        h2 = mezclar_arreglo(valores ^ np.uint64(0x5851F42D4C957F2D)) | np.uint64(1)
+        for i in range(self.num_funciones):
+            yield (h1 + np.uint64(i)*h2) % np.uint64(self.num_bits)
+
+    def agregar_lotes(self, lotes):
+        # Los bits se marcan en un arreglo bool (una asignacion por funcion, sin
+        # np.bitwise_or.at) y se empaquetan una sola vez al final
+        marcas = np.unpackbits(self.bits, count=self.num_bits, bitorder='little').view(bool)
+        for valores in lotes:
+            for posiciones in self.posiciones_lote(valores):
+                marcas[posiciones] = True
+        self.bits = np.packbits(marcas, bitorder='little')
+
+    def agregar_lote(self, valores):
+        self.agregar_lotes([valores])
+
+    def contiene(self, x):
+        bits = self.bits
+        return all(bits[posicion >> 3] >> (posicion & 7) & 1 for posicion in self.posiciones(x))
+
+    def contiene_lote(self, claves):
+        resultado = np.ones(len(claves), dtype=bool)
+        for posiciones in self.posiciones_lote(claves):
+            resultado &= (self.bits[posiciones >> np.uint64(3)] >> (posiciones & np.uint64(7))) & 1 == 1
+        return resultado
+
+def construir_filtro_bloom(lista, tasa_falsos_positivos=TASA_FALSOS_POSITIVOS):
+    # Filtro de Bloom construido junto a los datos, se consulta antes de la busqueda lineal
+    datos = np.asarray(lista)
+    filtro = FiltroBloom(len(datos), tasa_falsos_positivos)
+    filtro.agregar_lotes(datos[inicio:inicio+BLOQUE] for inicio in range(0, len(datos), BLOQUE))
+    return DatosConFiltro(lista, filtro)
+
+def busqueda_bloom(datos_con_filtro, x):
+    # Busqueda lineal que primero consulta el filtro: los fallos seguros se
+    # responden sin recorrer los datos
+    datos, filtro = datos_con_filtro
+    filtro.consultas += 1
+    if not filtro.contiene(x):
+        filtro.descartes += 1
+        return -1
+    posicion = busqueda_lineal(datos, x)
+    if posicion < 0:
+        filtro.falsos_positivos += 1
+    return posicion
+
+class ListaOrdenada:
+    # Lista ordenada que admite inserciones y eliminaciones sin reordenar todo.
+    # Los valores se guardan en bloques ordenados de a lo mas 2*carga elementos y
+    # maximos guarda el ultimo valor de cada bloque para encontrar el bloque con
+    # bisect: insertar y eliminar cuestan O(log n + carga) en lugar del O(n) de
+    # mover todos los elementos de una lista normal.
+    # indice es un arbol de Fenwick sobre los tamaños de los bloques para obtener
+    # la posicion global en O(log n); se reconstruye solo cuando cambia el numero
+    # de bloques (una division cada carga inserciones)
+    def __init__(self, valores=(), carga=CARGA):
+        self.carga = carga
+        valores = sorted(valores)
+        self.bloques = [valores[i:i+carga] for i in range(0, len(valores), carga)]
+        self.maximos = [bloque[-1] for bloque in self.bloques]
+        self.tamanio = len(valores)
+        self.reconstruir_indice()
+
+    def reconstruir_indice(self):
+        # Construccion en O(numero de bloques)
+        indice = [0] + [len(bloque) for bloque in self.bloques]
+        for j in range(1, len(indice)):
+            padre = j + (j & -j)
+            if padre < len(indice):
+                indice[padre] += indice[j]
+        self.indice = indice
+
+    def actualizar_indice(self, i, cambio):
+        j = i + 1
+        while j < len(self.indice):
+            self.indice[j] += cambio
+            j += j & -j
+
+    def elementos_antes(self, i):
+        # Suma de los tamaños de self.bloques[:i]
+        total = 0
+        while i > 0:
+            total += self.indice[i]
+            i -= i & -i
+        return total
+
+    def __len__(self):
+        return self.tamanio
+
+    def __iter__(self):
+        for bloque in self.bloques:
+            yield from bloque
+
+    def insertar(self, x):
+        if not self.bloques:
+            self.bloques.append([x])
+            self.maximos.append(x)
+            self.tamanio = 1
+            self.reconstruir_indice()
+            return
+        i = min(bisect_left(self.maximos, x), len(self.bloques)-1)
+        bloque = self.bloques[i]
+        insort(bloque, x)
+        self.maximos[i] = bloque[-1]
+        if len(bloque) > 2*self.carga:
+            # Dividir el bloque a la mitad para mantener las inserciones baratas
+            self.bloques[i:i+1] = [bloque[:self.carga], bloque[self.carga:]]
+            self.maximos[i:i+1] = [bloque[self.carga-1], bloque[-1]]
+            self.reconstruir_indice()
+        else:
+            self.actualizar_indice(i, 1)
+        self.tamanio += 1
+
+    def eliminar(self, x):
+        # Elimina una aparicion de x, regresa False si x no estaba
+        i = bisect_left(self.maximos, x)
+        if i == len(self.bloques):
+            return False
+        bloque = self.bloques[i]
+        posicion = bisect_left(bloque, x)
+        if bloque[posicion] != x:
+            return False
+        del bloque[posicion]
+        if bloque:
+            self.maximos[i] = bloque[-1]
+            self.actualizar_indice(i, -1)
+        else:
+            del self.bloques[i]
+            del self.maximos[i]
+            self.reconstruir_indice()
+        self.tamanio -= 1
+        return True
+
+    def buscar(self, x):
+        # Posicion de la primera aparicion de x o -1 en O(log n): bisect para el
+        # bloque y el arbol de Fenwick para los elementos de los bloques anteriores
+        i = bisect_left(self.maximos, x)
+        if i == len(self.bloques):
+            return -1
+        bloque = self.bloques[i]
+        posicion = bisect_left(bloque, x)
+        if bloque[posicion] != x:
+            return -1
+        return self.elementos_antes(i) + posicion
+
+def busqueda_binaria_lote(ordenados, claves):
+    # Responde todas las claves a la vez sobre la copia ordenada.
+    # Regresa (encontrados, posiciones) con posicion -1 si la clave no esta
+    ordenados = np.asarray(ordenados)
+    claves = np.asarray(claves)
+    posiciones = np.searchsorted(ordenados, claves)
+    validas = posiciones < len(ordenados)
+    encontrados = np.zeros(len(claves), dtype=bool)
+    encontrados[validas] = ordenados[posiciones[validas]] == claves[validas]
+    return encontrados, np.where(encontrados, posiciones, -1)
+
+def construir_indice_pertenencia(lista):
+    # Se construye una vez por generacion de datos, las consultas en lote ya no
+    # vuelven a ordenar los datos
+    valores, primeras = np.unique(np.asarray(lista), return_index=True)
+    return IndicePertenencia(valores, primeras)
+
+def busqueda_pertenencia_lote(indice, claves):
+    # Pertenencia de todas las claves a la vez sobre el indice de pertenencia.
+    # Las posiciones son la primera aparicion de cada clave en la lista original
+    encontrados, lugares = busqueda_binaria_lote(indice.valores, claves)
+    posiciones = np.full(len(encontrados), -1, dtype=np.int64)
+    posiciones[encontrados] = indice.primeras[lugares[encontrados]]
+    return encontrados, posiciones
+
+def medir_lote(funcion, datos, claves):
+    # Regresa (encontrados, posiciones, consultas por segundo)
+    inicio = perf_counter()
+    encontrados, posiciones = funcion(datos, claves)
+    total = perf_counter() - inicio
+    return encontrados, posiciones, len(claves) / total if total > 0 else float('inf')
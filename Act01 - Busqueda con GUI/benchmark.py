@@ -0,0 +1,93 @@
+import argparse
+import csv
+import json
+import sys
+import algoritmos
+import mediciones
+
+# Ejecución de los promedios sin interfaz (no importa tkinter ni matplotlib)
+# Ejemplo:
+#   python benchmark.py --tamanios 1000 100000 --distribucion uniforme sesgada --salida resultados.csv
+
+CAMPOS = ['estrategia', 'distribucion', 'n', 'repeticiones', 'construccion', 'consulta']
+
+
+def argumentos():
+    parser = argparse.ArgumentParser(description='Mide los algoritmos de búsqueda sin interfaz gráfica.')
+    parser.add_argument('--tamanios', type=int, nargs='+', default=mediciones.TAMANIOS)
+    parser.add_argument('--repeticiones', type=int, default=mediciones.REPETICIONES)
+    parser.add_argument('--distribucion', nargs='+', choices=algoritmos.DISTRIBUCIONES, default=['uniforme'])
+    parser.add_argument('--estrategias', nargs='+', choices=list(mediciones.ESTRATEGIAS),
+                        default=list(mediciones.ESTRATEGIAS))
+    parser.add_argument('--procesos', type=int, default=None,
+                        help='Procesos trabajadores (por defecto uno por núcleo, 1 = secuencial)')
+    parser.add_argument('--semilla', type=int, default=None, help='Semilla para generar datos reproducibles')
+    parser.add_argument('--fraccion-fallos', type=float, default=mediciones.FRACCION_FALLOS,
+                        help='Parte de las repeticiones que busca un valor ausente')
+    parser.add_argument('--tasa-bloom', type=float, default=algoritmos.TASA_FALSOS_POSITIVOS,
+                        help='Tasa de falsos positivos del filtro de Bloom')
+    parser.add_argument('--archivos', metavar='DIRECTORIO',
+                        help='Medir lineal y binaria sobre datos .npy en disco (np.memmap) guardados en DIRECTORIO')
+    parser.add_argument('--lote', type=int, metavar='CONSULTAS',
+                        help='Comparar búsqueda en lote con copia ordenada, árbol Eytzinger e índice de pertenencia')
+    parser.add_argument('--dinamico', type=int, metavar='OPERACIONES',
+                        help='Comparar inserciones/eliminaciones en una lista con bisect.insort '
+                             'contra la lista ordenada por bloques')
+    parser.add_argument('--salida', help='Archivo .csv o .json (por defecto CSV en la salida estándar)')
+    parser.add_argument('--sin-cache', action='store_true', help='No leer ni escribir cache_promedios.json')
+    parser.add_argument('--forzar', action='store_true', help='Volver a medir aunque exista en el cache')
+    args = parser.parse_args()
+    if not 0 <= args.fraccion_fallos <= 1:
+        parser.error('--fraccion-fallos debe estar entre 0 y 1')
+    if not 0 < args.tasa_bloom < 1:
+        parser.error('--tasa-bloom debe estar entre 0 y 1')
+    return args
+
+
+def ejecutar(args):
+    cache = None if args.sin_cache else mediciones.CacheResultados()
+    filas = []
+    for distribucion in args.distribucion:
+        if args.dinamico:
+            promedios = mediciones.calcular_promedios_dinamico(args.tamanios, args.dinamico, args.repeticiones,
+                                                               distribucion, args.semilla)
+        elif args.lote:
+            promedios = mediciones.calcular_promedios_lote(args.tamanios, args.lote, args.repeticiones,
+                                                           distribucion, args.semilla)
+        elif args.archivos:
+            promedios = mediciones.calcular_promedios_archivos(args.archivos, args.tamanios, args.repeticiones,
+                                                               distribucion, args.semilla)
+        else:
+            promedios = mediciones.calcular_promedios(args.tamanios, args.repeticiones, args.estrategias,
+                                                      cache=cache, forzar=args.forzar, distribucion=distribucion,
+                                                      procesos=args.procesos, semilla=args.semilla,
+                                                      fraccion_fallos=args.fraccion_fallos,
+                                                      tasa_falsos_positivos=args.tasa_bloom)
+        for n, resultados in promedios:
+            for estrategia, (construccion, consulta) in resultados.items():
+                filas.append({'estrategia': estrategia, 'distribucion': distribucion, 'n': n,
+                              'repeticiones': args.repeticiones, 'construccion': construccion,
+                              'consulta': consulta})
+            print(f'{distribucion} n={n} listo', file=sys.stderr)
+    return filas
+
+
+def escribir(filas, salida):
+    if salida is not None and salida.endswith('.json'):
+        with open(salida, 'w', encoding='utf-8') as archivo:
+            json.dump(filas, archivo, indent=1)
+        return
+
+    archivo = open(salida, 'w', newline='', encoding='utf-8') if salida else sys.stdout
+    try:
+        escritor = csv.DictWriter(archivo, fieldnames=CAMPOS)
+        escritor.writeheader()
+        escritor.writerows(filas)
+    finally:
+        if salida:
+            archivo.close()
+
+
+if __name__ == '__main__':
+    args = argumentos()
+    escribir(ejecutar(args), args.salida)
@@ -1,30 +1,79 @@
+import queue
+import threading
 import tkinter as tk
 from time import perf_counter
-from tkinter import messagebox
+from tkinter import messagebox, ttk
 import numpy as np
 import algoritmos
+import mediciones
+import paralelo
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
 
 
+# Número de claves por búsqueda en lote
+CONSULTAS_LOTE = 1000000
+# Milisegundos entre revisiones de la cola de promedios
+INTERVALO_REVISION = 100
+# Botones de búsqueda por fila
+COLUMNAS_BOTONES = 3
+# Tasas de falsos positivos que se pueden elegir para el filtro de Bloom
+TASAS_BLOOM = ('0.1', '0.01', '0.001', '0.0001')
+ETIQUETAS = {'lineal': 'Lineal', 'vectorizada': 'Lineal vectorizada', 'bloom': 'Lineal + Bloom',
+             'binaria': 'Binaria', 'interpolacion': 'Interpolación',
+             'exponencial': 'Exponencial', 'eytzinger': 'Eytzinger',
+             'hash': 'Hash', 'paralela': 'Lineal paralela'}
+MARCADORES = {'lineal': 'o', 'vectorizada': '*', 'bloom': 'p', 'binaria': 's', 'interpolacion': 'v', 'exponencial': '^', 'eytzinger': 'X', 'hash': 'D',
+              'paralela': 'P'}
+NOMBRES_INDICE = {algoritmos.ordenar_datos: 'copia ordenada',
+                  algoritmos.construir_filtro_bloom: 'filtro de Bloom',
+                  algoritmos.construir_eytzinger: 'árbol Eytzinger',
+                  algoritmos.construir_indice_hash: 'índice hash',
+                  algoritmos.construir_indice_pertenencia: 'índice de pertenencia',
+                  paralelo.BuscadorParalelo: 'memoria compartida y procesos'}
+
+
 # Función principal
 def iniciar():
     # Creacion de la ventana principal
     ventana = tk.Tk()
-    ventana.geometry('650x1000')
+    ventana.geometry('800x1000')
     ventana.title('Busqueda con GUI')
     # Variables locales a utilizar
-    listaDatos = []
+    # Los datos se guardan como arreglo contiguo de int64 (sin enteros encapsulados)
+    listaDatos = np.empty(0, dtype=np.int64)
+    # Generacion de los datos, se incrementa cada vez que se generan datos nuevos
+    generacion = 0
+    indiceOrdenado = algoritmos.Indice(algoritmos.ordenar_datos)
+    tasaBloom = tk.StringVar()
+    tasaBloom.set(str(algoritmos.TASA_FALSOS_POSITIVOS))
+    indiceBloom = algoritmos.Indice(lambda lista: algoritmos.construir_filtro_bloom(lista, float(tasaBloom.get())))
+    # Al cambiar la tasa el filtro se vuelve a construir en la siguiente búsqueda
+    tasaBloom.trace_add('write', lambda *args: setattr(indiceBloom, 'generacion', None))
+    indices = {algoritmos.ordenar_datos: indiceOrdenado,
+               algoritmos.construir_filtro_bloom: indiceBloom,
+               algoritmos.construir_eytzinger: algoritmos.Indice(algoritmos.construir_eytzinger),
+               algoritmos.construir_indice_hash: algoritmos.Indice(algoritmos.construir_indice_hash),
+               algoritmos.construir_indice_pertenencia: algoritmos.Indice(algoritmos.construir_indice_pertenencia),
+               paralelo.BuscadorParalelo: algoritmos.Indice(paralelo.BuscadorParalelo)}
     numElementos = tk.StringVar()
     numElementos.set('10')
+    distribucion = tk.StringVar()
+    distribucion.set(algoritmos.DISTRIBUCIONES[0])
     numBuscar =tk.StringVar()
     numBuscar.set('Ingresa el dato a buscar')
 
-    # Guardar resultados
-    tiemposLineal=[]
-    tamanosLineal=[]
-    tiemposBinaria=[]
-    tamanosBinaria=[]
+    # Guardar resultados por estrategia (mediciones.Medicion por búsqueda)
+    tiempos = {nombre: [] for nombre in ETIQUETAS}
+    tamanos = {nombre: [] for nombre in ETIQUETAS}
+    # Promedios recibidos del hilo trabajador: [(n, {estrategia: (construccion, consulta)})]
+    resultadosPromedio = []
+    cancelarPromedios = threading.Event()
+    # Promedios ya medidos guardados en disco
+    cachePromedios = mediciones.CacheResultados()
+    forzarMedicion = tk.BooleanVar(value=False)
+    # Repetir cada búsqueda hasta tener una medición estable en lugar de una sola muestra
+    medicionEstadistica = tk.BooleanVar(value=False)
 
     # Frame para resultados + scroll
     frame_resultados = tk.Frame(ventana)
@@ -54,6 +103,7 @@ def iniciar():
 
     # Funcion para generar num aleatorios
     def generar():
+        nonlocal listaDatos, generacion
         try:
             n = int(numElementos.get())
             if n<= 0:
@@ -62,14 +112,20 @@ def iniciar():
             messagebox.showerror("Error", "Numero de elementos invalido")
             return
 
-        datos = algoritmos.generar_datos(n)
-        listaDatos.clear()
-        listaDatos.extend(datos)
-        messagebox.showinfo("Resultado", f"{numElementos.get()} numeros generados con exito!")
+        listaDatos = algoritmos.generar_datos(n, distribucion.get())
+        generacion += 1
+        messagebox.showinfo("Resultado", f"{numElementos.get()} numeros generados con exito! "
+                                         f"(distribución {distribucion.get()})")
+
+    def texto_medicion(medicion):
+        if medicion.repeticiones == 1:
+            return f'Tiempo: {medicion.mediana:.10f}s'
+        return (f'Tiempo: mediana {medicion.mediana:.10f}s  IQR {medicion.iqr:.2e}s  '
+                f'mín {medicion.minimo:.10f}s  ({medicion.repeticiones} llamadas por ronda)')
 
     # Lógica de los casos
-    def busqueda_lineal():
-        if not  listaDatos:
+    def buscar(nombre):
+        if listaDatos.size == 0:
             messagebox.showerror("Error", "No hay datos")
             return
 
@@ -79,93 +135,189 @@ def iniciar():
             messagebox.showerror("Error", "Numero invalido")
             return
 
+        # Las estructuras auxiliares (copia ordenada, índice hash) se construyen
+        # una sola vez por generacion de datos y se comparten entre estrategias
+        construir, funcion = mediciones.ESTRATEGIAS[nombre]
+        estructura = listaDatos
+        if construir is not None:
+            indice = indices[construir]
+            estructura, construido = indice.obtener(listaDatos, generacion)
+            if construido:
+                agregar_resultado(f'B. {ETIQUETAS[nombre]}: {NOMBRES_INDICE[construir]} construido (una vez) '
+                                  f'Tiempo: {indice.tiempo_construccion:.10f}s')
+
         inicio = perf_counter()
-        encontrado = algoritmos.busqueda_lineal(listaDatos, x)
+        posicion = funcion(estructura, x)
         final = perf_counter()
-
-        if encontrado:
-            textoC = (f'B. Lineal: Número {x} encontrado en el índice [{listaDatos.index(x)}]  '
-                      f'Tiempo: {final-inicio:.10f}s\n')
+        filtro = getattr(estructura, 'filtro', None)
+        if filtro is not None:
+            contadores = (filtro.consultas, filtro.descartes, filtro.falsos_positivos)
+        if medicionEstadistica.get():
+            medicion = mediciones.medir(funcion, estructura, x)
+        else:
+            medicion = mediciones.Medicion(final-inicio, 0.0, final-inicio, 1)
+        if filtro is not None:
+            # Las repeticiones de la medición no cuentan como consultas
+            filtro.consultas, filtro.descartes, filtro.falsos_positivos = contadores
+            agregar_resultado(f'Filtro de Bloom: {filtro.consultas} consultas, {filtro.descartes} descartadas '
+                              f'sin recorrer los datos, {filtro.falsos_positivos} falsos positivos')
+
+        if posicion >= 0:
+            if construir is algoritmos.ordenar_datos:
+                # En datos ordenados todas las apariciones forman un rango contiguo
+                desde, hasta = algoritmos.rango_igual(estructura, x)
+                textoC = (f'B. {ETIQUETAS[nombre]}: Número {x} encontrado en el índice [{posicion}] de la copia '
+                          f'ordenada, {hasta-desde} apariciones en [{desde}, {hasta})  '
+                          f'{texto_medicion(medicion)}\n')
+            else:
+                textoC = (f'B. {ETIQUETAS[nombre]}: Número {x} encontrado en el índice [{posicion}]  '
+                          f'{texto_medicion(medicion)}\n')
             agregar_resultado(textoC)
-            tiemposLineal.append(final-inicio)
-            tamanosLineal.append(len(listaDatos))
+            tiempos[nombre].append(medicion)
+            tamanos[nombre].append(len(listaDatos))
             actualizar_grafica()
-            actualizar_grafica_promedio()
         else:
-            agregar_resultado(f"B. Lineal: Número {x} no encontrado\n")
+            agregar_resultado(f"B. {ETIQUETAS[nombre]}: Número {x} no encontrado\n")
 
-    def busqueda_binaria():
-        if not listaDatos:
+    def busqueda_lote():
+        if listaDatos.size == 0:
             messagebox.showerror("Error", "No hay datos")
             return
-        try:
-            x = int(numBuscar.get())
-        except ValueError:
-            messagebox.showerror("Error", "Numero invalido")
-            return
 
-        inicio = perf_counter()
-        encontrado = algoritmos.busqueda_binaria(listaDatos, x)
-        final = perf_counter()
-        if encontrado:
-            textoC = (f'B. Binaria: Número {x} encontrado en el índice [{listaDatos.index(x)}]  '
-                      f'Tiempo: {final-inicio:.10f}s\n')
-            agregar_resultado(textoC)
-            tiemposBinaria.append(final-inicio)
-            tamanosBinaria.append(len(listaDatos))
-            actualizar_grafica()
-        else:
-            agregar_resultado(f"B. Binaria: Número {x} no encontrado\n")
+        # Claves aleatorias en [1, 2n] para tener aciertos y fallos
+        n = len(listaDatos)
+        claves = np.random.randint(1, 2*n+1, size=CONSULTAS_LOTE)
+
+        ordenados, construido = indiceOrdenado.obtener(listaDatos, generacion)
+        if construido:
+            agregar_resultado(f'B. Binaria: copia ordenada construida (una vez) '
+                              f'Tiempo: {indiceOrdenado.tiempo_construccion:.10f}s')
+
+        encontrados, _, velocidad = algoritmos.medir_lote(algoritmos.busqueda_binaria_lote, ordenados, claves)
+        agregar_resultado(f'Lote binario: {CONSULTAS_LOTE} consultas, {encontrados.sum()} encontradas  '
+                          f'{velocidad:,.0f} consultas/s\n')
+
+        indiceEytzinger = indices[algoritmos.construir_eytzinger]
+        arbol, construido = indiceEytzinger.obtener(listaDatos, generacion)
+        if construido:
+            agregar_resultado(f'B. Eytzinger: árbol Eytzinger construido (una vez) '
+                              f'Tiempo: {indiceEytzinger.tiempo_construccion:.10f}s')
+
+        encontrados, _, velocidad = algoritmos.medir_lote(algoritmos.busqueda_eytzinger_lote, arbol, claves)
+        agregar_resultado(f'Lote Eytzinger: {CONSULTAS_LOTE} consultas, {encontrados.sum()} encontradas  '
+                          f'{velocidad:,.0f} consultas/s\n')
+
+        indicePertenencia = indices[algoritmos.construir_indice_pertenencia]
+        pertenencia, construido = indicePertenencia.obtener(listaDatos, generacion)
+        if construido:
+            agregar_resultado(f'B. Pertenencia: índice de pertenencia construido (una vez) '
+                              f'Tiempo: {indicePertenencia.tiempo_construccion:.10f}s')
+
+        encontrados, _, velocidad = algoritmos.medir_lote(algoritmos.busqueda_pertenencia_lote, pertenencia, claves)
+        agregar_resultado(f'Lote pertenencia: {CONSULTAS_LOTE} consultas, {encontrados.sum()} encontradas  '
+                          f'{velocidad:,.0f} consultas/s\n')
+
+    # Cálculo de promedios en segundo plano: el hilo trabajador deja resultados
+    # parciales en una cola que la ventana revisa con after()
+    def trabajador_promedios(cola, cancelar, forzar, distribucion, tasa):
+        try:
+            for n, resultados in mediciones.calcular_promedios(cancelar=cancelar, cache=cachePromedios,
+                                                               forzar=forzar, distribucion=distribucion,
+                                                               tasa_falsos_positivos=tasa):
+                cola.put((n, resultados))
+        finally:
+            cola.put(None)
 
     def calcular_promedios():
-        tamanios = [100, 1000, 10000, 100000, 1000000]  # Tamaños de prueba
-        repeticiones = 5  # Número de repeticiones por caso
-
-        tiempos_lineal = []
-        tiempos_binaria = []
-
-        for n in tamanios:
-            tiempos_l = []
-            tiempos_b = []
+        nonlocal cancelarPromedios
+        cancelarPromedios.set()  # Cancelar un cálculo anterior si sigue activo
+        cancelarPromedios = threading.Event()
+        cola = queue.Queue()
 
-            for _ in range(repeticiones):
-                # Generar nueva lista de datos
-                datos = algoritmos.generar_datos(n)
-
-                # Elegir un número al azar de la lista
-                x = np.random.choice(datos)
-
-                # Búsqueda lineal
-                inicio = perf_counter()
-                algoritmos.busqueda_lineal(datos, x)
-                tiempos_l.append(perf_counter() - inicio)
+        resultadosPromedio.clear()
+        actualizar_grafica_promedio()
+        barraProgreso.config(value=0)
+        lblProgreso.config(text=f'Promedios: 0/{len(mediciones.TAMANIOS)} tamaños')
+        btnPromedios.config(state='disabled')
 
-                # Búsqueda binaria
-                inicio = perf_counter()
-                algoritmos.busqueda_binaria(datos, x)
-                tiempos_b.append(perf_counter() - inicio)
+        threading.Thread(target=trabajador_promedios, args=(cola, cancelarPromedios, forzarMedicion.get(), distribucion.get(),
+                                                                 float(tasaBloom.get())),
+                         daemon=True).start()
+        ventana.after(INTERVALO_REVISION, revisar_promedios, cola, cancelarPromedios)
 
-            # Promediar tiempos
-            tiempos_lineal.append(np.mean(tiempos_l))
-            tiempos_binaria.append(np.mean(tiempos_b))
+    def revisar_promedios(cola, cancelar):
+        terminado = False
+        try:
+            while True:
+                mensaje = cola.get_nowait()
+                if mensaje is None:
+                    terminado = True
+                    break
+                if not cancelar.is_set():
+                    resultadosPromedio.append(mensaje)
+                    reportar_factor_lineal(*mensaje)
+                    reportar_equilibrios(*mensaje)
+        except queue.Empty:
+            pass
+
+        # Un cálculo cancelado ya no actualiza la interfaz
+        if cancelar.is_set():
+            return
 
-        return tamanios, tiempos_lineal, tiempos_binaria
+        barraProgreso.config(value=len(resultadosPromedio))
+        lblProgreso.config(text=f'Promedios: {len(resultadosPromedio)}/{len(mediciones.TAMANIOS)} tamaños')
+        actualizar_grafica_promedio()
+        if terminado:
+            btnPromedios.config(state='normal')
+        else:
+            ventana.after(INTERVALO_REVISION, revisar_promedios, cola, cancelar)
+
+    def reportar_factor_lineal(n, resultados):
+        # Ambas son O(n): la diferencia es solo el factor constante
+        python, vectorizada = resultados['lineal'][1], resultados['vectorizada'][1]
+        if vectorizada > 0:
+            agregar_resultado(f'n={n}: Lineal en Python / Lineal vectorizada = {python/vectorizada:,.1f}x')
+
+    def reportar_equilibrios(n, resultados):
+        # A partir de cuántas consultas conviene pagar la construcción de cada estrategia
+        for (a, b), consultas in mediciones.equilibrios(resultados).items():
+            rapida = a if resultados[a][1] < resultados[b][1] else b
+            lenta = b if rapida == a else a
+            if consultas is None:
+                total_a = resultados[a][0] + resultados[a][1]
+                total_b = resultados[b][0] + resultados[b][1]
+                ganadora = a if total_a <= total_b else b
+                agregar_resultado(f'n={n}: {ETIQUETAS[ganadora]} siempre conviene frente a '
+                                  f'{ETIQUETAS[b if ganadora == a else a]}')
+            else:
+                agregar_resultado(f'n={n}: {ETIQUETAS[rapida]} supera a {ETIQUETAS[lenta]} '
+                                  f'a partir de ~{consultas:,.0f} consultas')
 
     def actualizar_grafica_promedio():
         figPromedio.clear()
         ax = figPromedio.add_subplot(111)
 
-        tamanios, tiempos_lineal, tiempos_binaria = calcular_promedios()
-
-        ax.plot(tamanios, tiempos_lineal, marker='o', label='Lineal')
-        ax.plot(tamanios, tiempos_binaria, marker='s', label='Binaria')
+        if resultadosPromedio:
+            tamanios = [n for n, _ in resultadosPromedio]
+            graficados = set()
+            for nombre, etiqueta in ETIQUETAS.items():
+                ax.plot(tamanios, [resultados[nombre][1] for _, resultados in resultadosPromedio],
+                        marker=MARCADORES[nombre], label=etiqueta)
+                # Costo de construcción (una vez por conjunto de datos) en línea punteada,
+                # una sola línea por estructura compartida
+                construir = mediciones.ESTRATEGIAS[nombre][0]
+                if construir is not None and construir not in graficados:
+                    graficados.add(construir)
+                    ax.plot(tamanios, [resultados[nombre][0] for _, resultados in resultadosPromedio],
+                            marker=MARCADORES[nombre], linestyle='--',
+                            label=f'Construcción {NOMBRES_INDICE[construir]} (una vez)')
+            ax.legend()
 
         ax.set_xscale('log')
         ax.set_yscale('log')
         ax.set_xlabel('Tamaño de lista')
         ax.set_ylabel('Tiempo promedio (s)')
         ax.set_title('Comparación de algoritmos (promedios)')
-        ax.legend()
         canvasPromedio.draw()
 
     # Función para actualizar la gráfica
@@ -173,25 +325,30 @@ def iniciar():
         fig.clear()
         ax = fig.add_subplot(111)
 
-        if tiemposLineal:
-            ax.plot(tamanosLineal, tiemposLineal, marker='o', label='Lineal')
-        if tiemposBinaria:
-            ax.plot(tamanosBinaria, tiemposBinaria, marker='s', label='Binaria')
+        for nombre, etiqueta in ETIQUETAS.items():
+            if tiempos[nombre]:
+                ax.plot(tamanos[nombre], [medicion.mediana for medicion in tiempos[nombre]],
+                        marker=MARCADORES[nombre], label=etiqueta)
 
         ax.set_xscale('log')
         ax.set_yscale('log')
         ax.set_xlabel('Tamaño de lista')
         ax.set_ylabel('Tiempo (s)')
         ax.set_title('Comparación de algoritmos de búsqueda')
-        if tiemposLineal or tiemposBinaria:
+        if any(tiempos.values()):
             ax.legend()
         canvas.draw()
 
     def reiniciar():
-        tamanosLineal.clear()
-        tamanosBinaria.clear()
-        tiemposLineal.clear()
-        tiemposBinaria.clear()
+        for nombre in ETIQUETAS:
+            tiempos[nombre].clear()
+            tamanos[nombre].clear()
+        # Cancelar el cálculo de promedios en curso
+        cancelarPromedios.set()
+        resultadosPromedio.clear()
+        barraProgreso.config(value=0)
+        lblProgreso.config(text='')
+        btnPromedios.config(state='normal')
         actualizar_grafica()
         actualizar_grafica_promedio()
 
@@ -204,8 +361,10 @@ def iniciar():
 
     # Diseño de instrucciones
     lblPrincipal = tk.Label(ventana, text='Selecciona un número de datos a generar:', font=('Arial', 14))
-    menuOpciones = tk.OptionMenu(ventana, numElementos,'10', '100', '1000', '10000', '100000', '1000000')
+    menuOpciones = tk.OptionMenu(ventana, numElementos,'10', '100', '1000', '10000', '100000', '1000000', '10000000')
     menuOpciones.config(bg='light blue', fg='black', font=('Arial', 12), width=15)
+    menuDistribucion = tk.OptionMenu(ventana, distribucion, *algoritmos.DISTRIBUCIONES)
+    menuDistribucion.config(bg='light blue', fg='black', font=('Arial', 12), width=15)
     btnNumDatos = tk.Button(ventana, text="Generar Datos", activebackground='light gray', cursor='hand2', relief='groove',
                             command= generar)
 
@@ -213,20 +372,43 @@ def iniciar():
     lblEntrada = tk.Entry(ventana, textvariable=numBuscar, fg='gray', font=('Arial', 12, 'italic'))
     lblEntrada.bind("<FocusIn>", seleccionar_texto)
 
-    # Diseño botones de busqueda
-    btnLineal = tk.Button(ventana, text="Busqueda Lineal", activebackground='light gray', cursor='hand2', relief='groove',
-                          command= busqueda_lineal)
-    btnBinario = tk.Button(ventana, text="Busqueda Binaria", activebackground='light gray', cursor='hand2', relief='groove',
-                           command= busqueda_binaria)
+    # Diseño botones de busqueda, uno por estrategia, en filas de COLUMNAS_BOTONES
+    # para que todos quepan en el ancho de la ventana
+    frame_botones = tk.Frame(ventana)
+    for posicion, (nombre, etiqueta) in enumerate(ETIQUETAS.items()):
+        tk.Button(frame_botones, text=f"Busqueda {etiqueta}", activebackground='light gray', cursor='hand2',
+                  relief='groove', command=lambda nombre=nombre: buscar(nombre)).grid(
+            row=posicion // COLUMNAS_BOTONES, column=posicion % COLUMNAS_BOTONES, padx=3, pady=2, sticky='ew')
+    frame_bloom = tk.Frame(ventana)
+    tk.Label(frame_bloom, text='Tasa de falsos positivos (Bloom):').pack(side="left")
+    menuTasa = tk.OptionMenu(frame_bloom, tasaBloom, *TASAS_BLOOM)
+    menuTasa.config(bg='light blue', fg='black', font=('Arial', 10))
+    menuTasa.pack(side="left", padx=3)
+    chkEstadistica = tk.Checkbutton(ventana, text="Medición estadística (mediana de varias rondas)",
+                                    variable=medicionEstadistica)
+    btnLote = tk.Button(ventana, text="Busqueda por Lote", activebackground='light gray', cursor='hand2', relief='groove',
+                        command= busqueda_lote)
+    btnPromedios = tk.Button(ventana, text="Calcular Promedios", activebackground='light gray', cursor='hand2',
+                             relief='groove', command= calcular_promedios)
+    chkForzar = tk.Checkbutton(ventana, text="Forzar re-medición", variable=forzarMedicion)
+    barraProgreso = ttk.Progressbar(ventana, maximum=len(mediciones.TAMANIOS), length=200)
+    lblProgreso = tk.Label(ventana, text='', font=('Arial', 10))
     btnReiniciar = tk.Button(ventana, text="Reiniciar", activebackground='light gray', cursor='hand2', command= reiniciar)
 
     # Elementos.pack
     lblPrincipal.pack(pady = 10)
     menuOpciones.pack()
+    menuDistribucion.pack(pady = 5)
     btnNumDatos.pack(pady = 10)
     lblEntrada.pack(pady= 20)
-    btnLineal.pack(pady = 10)
-    btnBinario.pack(pady = 10)
+    frame_botones.pack(pady = 10)
+    frame_bloom.pack()
+    chkEstadistica.pack()
+    btnLote.pack(pady = 10)
+    btnPromedios.pack(pady = 10)
+    chkForzar.pack()
+    barraProgreso.pack()
+    lblProgreso.pack()
     frame_resultados.pack(fill="both", expand=True, padx=10, pady=10)
     txtResultados.pack(side="left", fill="both", expand=True)
     scrollbar.pack(side="right", fill="y")
@@ -235,5 +417,14 @@ def iniciar():
     canvasPromedio.get_tk_widget().pack(pady=20)
 
 
+    # Al cerrar se liberan los procesos y la memoria compartida de la búsqueda paralela
+    def cerrar_ventana():
+        cancelarPromedios.set()
+        buscador = indices[paralelo.BuscadorParalelo].datos
+        if buscador is not None:
+            buscador.cerrar()
+        ventana.destroy()
+
+    ventana.protocol("WM_DELETE_WINDOW", cerrar_ventana)
     ventana.mainloop()
 
@@ -0,0 +1,415 @@
+import bisect
+import gc
+import json
+import multiprocessing
+import os
+import platform
+import tempfile
+import threading
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, wait
+from functools import partial
+from time import perf_counter
+import numpy as np
+import algoritmos
+import paralelo
+
+TAMANIOS = [100, 1000, 10000, 100000, 1000000]  # Tamaños de prueba
+REPETICIONES = 5  # Número de repeticiones por caso
+FRACCION_FALLOS = 0.5  # Parte de las repeticiones que busca un valor ausente (fuera de [1, n])
+ESPERA_CANCELACION = 0.1  # Segundos entre revisiones de cancelar mientras se espera a un proceso
+
+# Cache de promedios en disco. Cambiar VERSION_CACHE invalida todo lo guardado
+RUTA_CACHE = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'cache_promedios.json')
+VERSION_CACHE = 2
+
+# Medición estadística de una sola búsqueda
+UMBRAL_MEDICION = 0.05  # Segundos mínimos por ronda
+RONDAS = 7
+CALENTAMIENTO = 3
+# Tiempos por llamada: mediana, rango intercuartil, mínimo y llamadas por ronda
+Medicion = namedtuple('Medicion', 'mediana iqr minimo repeticiones')
+
+# Estrategias de búsqueda: nombre -> (construir, buscar)
+# construir es None cuando la estrategia no necesita preparar los datos
+ESTRATEGIAS = {
+    'lineal': (None, algoritmos.busqueda_lineal),
+    'vectorizada': (None, algoritmos.busqueda_lineal_vectorizada),
+    'bloom': (algoritmos.construir_filtro_bloom, algoritmos.busqueda_bloom),
+    'binaria': (algoritmos.ordenar_datos, algoritmos.busqueda_binaria),
+    'interpolacion': (algoritmos.ordenar_datos, algoritmos.busqueda_interpolacion),
+    'exponencial': (algoritmos.ordenar_datos, algoritmos.busqueda_exponencial),
+    'eytzinger': (algoritmos.construir_eytzinger, algoritmos.busqueda_eytzinger),
+    'hash': (algoritmos.construir_indice_hash, algoritmos.busqueda_hash),
+    'paralela': (paralelo.BuscadorParalelo, paralelo.busqueda_paralela),
+}
+
+# Estrategias que crean su propio grupo de procesos y no deben medirse dentro
+# de los trabajadores del barrido
+ESTRATEGIAS_EXCLUSIVAS = {'paralela'}
+
+def medir_estrategia(nombre, datos, x, construidos=None, parametros=None):
+    # Regresa (tiempo de construccion, tiempo de consulta).
+    # construidos es un dict opcional construir -> (estructura, tiempo) para que las
+    # estrategias que comparten la misma estructura (la copia ordenada) la construyan una vez.
+    # parametros es un dict opcional construir -> argumentos con nombre para construir
+    construir, buscar = ESTRATEGIAS[nombre]
+    construccion = 0.0
+    estructura = datos
+    if construir is not None:
+        if construidos is not None and construir in construidos:
+            estructura, construccion = construidos[construir]
+        else:
+            inicio = perf_counter()
+            estructura = construir(datos, **(parametros or {}).get(construir, {}))
+            construccion = perf_counter() - inicio
+            if construidos is not None:
+                construidos[construir] = (estructura, construccion)
+    inicio = perf_counter()
+    buscar(estructura, x)
+    return construccion, perf_counter() - inicio
+
+def medir(funcion, *args, umbral=UMBRAL_MEDICION, rondas=RONDAS, calentamiento=CALENTAMIENTO):
+    # Mide funcion(*args) repitiendola hasta que cada ronda supere el umbral,
+    # asi el tiempo no queda por debajo de la resolucion del reloj.
+    # El recolector de basura se desactiva durante las rondas cronometradas
+    for _ in range(calentamiento):
+        funcion(*args)
+
+    def ronda(repeticiones):
+        inicio = perf_counter()
+        for _ in range(repeticiones):
+            funcion(*args)
+        return perf_counter() - inicio
+
+    gc_activo = gc.isenabled()
+    gc.disable()
+    try:
+        # Duplicar las llamadas por ronda hasta superar el umbral
+        repeticiones = 1
+        total = ronda(repeticiones)
+        while total < umbral:
+            repeticiones *= 2
+            total = ronda(repeticiones)
+        muestras = [total / repeticiones] + [ronda(repeticiones) / repeticiones for _ in range(rondas-1)]
+    finally:
+        if gc_activo:
+            gc.enable()
+
+    cuartil_1, _, cuartil_3 = np.percentile(muestras, [25, 50, 75])
+    return Medicion(float(np.median(muestras)), float(cuartil_3 - cuartil_1), min(muestras), repeticiones)
+
+def clave_cache(estrategia, n, repeticiones, distribucion='uniforme', fraccion_fallos=FRACCION_FALLOS,
+                tasa_falsos_positivos=algoritmos.TASA_FALSOS_POSITIVOS):
+    # Un resultado solo es valido para el mismo generador, las mismas consultas y
+    # la misma version de Python y NumPy; la tasa solo cambia el filtro de Bloom
+    partes = [estrategia, str(n), str(repeticiones), f'generar_datos:{distribucion}', f'fallos:{fraccion_fallos}']
+    if ESTRATEGIAS[estrategia][0] is algoritmos.construir_filtro_bloom:
+        partes.append(f'tasa:{tasa_falsos_positivos}')
+    return '|'.join(partes + [platform.python_version(), np.__version__])
+
+class CacheResultados:
+    # Promedios guardados en un archivo JSON: clave_cache -> [construccion, consulta]
+    def __init__(self, ruta=RUTA_CACHE):
+        self.ruta = ruta
+        self.resultados = {}
+        # Un barrido cancelado y el siguiente pueden usar el mismo cache a la vez
+        self.candado = threading.Lock()
+        self.cargar()
+
+    def cargar(self):
+        try:
+            with open(self.ruta, encoding='utf-8') as archivo:
+                contenido = json.load(archivo)
+        except (OSError, ValueError):
+            return
+        if contenido.get('version') == VERSION_CACHE:
+            self.resultados = contenido.get('resultados', {})
+
+    def obtener(self, clave):
+        valor = self.resultados.get(clave)
+        return tuple(valor) if valor is not None else None
+
+    def guardar(self, clave, valor):
+        with self.candado:
+            self.resultados[clave] = list(valor)
+
+    def escribir(self):
+        # Se escribe a un archivo temporal unico para no dejar el cache a medias
+        directorio = os.path.dirname(os.path.abspath(self.ruta))
+        with self.candado:
+            with tempfile.NamedTemporaryFile('w', encoding='utf-8', dir=directorio, suffix='.tmp',
+                                             delete=False) as archivo:
+                json.dump({'version': VERSION_CACHE, 'resultados': self.resultados}, archivo, indent=1)
+            try:
+                os.replace(archivo.name, self.ruta)
+            except OSError:
+                os.remove(archivo.name)
+                raise
+
+def medir_repeticion(n, repeticion, estrategias, distribucion, semilla, fraccion_fallos=FRACCION_FALLOS,
+                     tasa_falsos_positivos=algoritmos.TASA_FALSOS_POSITIVOS):
+    # Una repeticion independiente que genera sus propios datos a partir de
+    # (semilla, n, repeticion), por eso se puede ejecutar en cualquier proceso.
+    # Las repeticiones que buscan un valor ausente se reparten de forma uniforme:
+    # son las que hacen que la parte entera de repeticion*fraccion_fallos avance
+    rng = np.random.default_rng([semilla, n, repeticion])
+    datos = algoritmos.generar_datos(n, distribucion, rng)
+    if int((repeticion+1) * fraccion_fallos) > int(repeticion * fraccion_fallos):
+        x = int(rng.integers(n+1, 2*n+1))
+    else:
+        x = int(rng.choice(datos))
+    parametros = {algoritmos.construir_filtro_bloom: {'tasa_falsos_positivos': tasa_falsos_positivos}}
+
+    construidos = {}
+    try:
+        return [medir_estrategia(nombre, datos, x, construidos, parametros) for nombre in estrategias]
+    finally:
+        # Liberar estructuras con recursos del sistema (procesos, memoria compartida)
+        for estructura, _ in construidos.values():
+            if hasattr(estructura, 'cerrar'):
+                estructura.cerrar()
+
+def esperar(tarea, cancelar):
+    # Resultado de una tarea (Future o llamada pendiente) o None si se cancela
+    if cancelar is not None and cancelar.is_set():
+        return None
+    if callable(tarea):
+        return tarea()
+    while not wait([tarea], timeout=ESPERA_CANCELACION).done:
+        if cancelar is not None and cancelar.is_set():
+            return None
+    return tarea.result()
+
+def calcular_promedios(tamanios=TAMANIOS, repeticiones=REPETICIONES, estrategias=tuple(ESTRATEGIAS),
+                       cancelar=None, cache=None, forzar=False, distribucion='uniforme',
+                       procesos=None, semilla=None, fraccion_fallos=FRACCION_FALLOS,
+                       tasa_falsos_positivos=algoritmos.TASA_FALSOS_POSITIVOS):
+    # Generador que produce (n, {estrategia: (construccion, consulta)}) al terminar cada tamaño.
+    # fraccion_fallos es la parte de las repeticiones que busca un valor ausente y
+    # tasa_falsos_positivos se usa al construir el filtro de Bloom.
+    # cancelar es un threading.Event opcional que se revisa entre repeticiones.
+    # Con cache solo se miden las estrategias que no tengan resultado guardado,
+    # forzar=True vuelve a medir todo y sobrescribe el cache.
+    # Cada (tamaño, repeticion) es una tarea de un ProcessPoolExecutor con procesos
+    # trabajadores (None = uno por núcleo, 1 = secuencial en este proceso); los
+    # resultados se juntan en orden, así que con la misma semilla el resultado no
+    # depende de cuál proceso termine primero
+    if semilla is None:
+        semilla = np.random.SeedSequence().entropy
+
+    pendientes = []
+    for n in tamanios:
+        promedios = {}
+        if cache is not None and not forzar:
+            for nombre in estrategias:
+                guardado = cache.obtener(clave_cache(nombre, n, repeticiones, distribucion, fraccion_fallos,
+                                                     tasa_falsos_positivos))
+                if guardado is not None:
+                    promedios[nombre] = guardado
+        faltantes = [nombre for nombre in estrategias if nombre not in promedios]
+        pendientes.append((n, promedios, faltantes))
+
+    # Las estrategias con su propio grupo de procesos se miden en este proceso y
+    # con el ejecutor sin trabajo, si no cada trabajador crearia otro grupo y los
+    # tiempos se tomarian con la maquina sobresuscrita
+    hay_exclusivas = any(nombre in ESTRATEGIAS_EXCLUSIVAS for _, _, faltantes in pendientes for nombre in faltantes)
+
+    ejecutor = None
+    if procesos != 1 and any(nombre not in ESTRATEGIAS_EXCLUSIVAS
+                             for _, _, faltantes in pendientes for nombre in faltantes):
+        # spawn: el proceso que llama puede tener hilos (la interfaz)
+        ejecutor = ProcessPoolExecutor(max_workers=procesos, mp_context=multiprocessing.get_context('spawn'))
+
+    def enviar(n, nombres, en_ejecutor=True):
+        argumentos = [(n, repeticion, nombres, distribucion, semilla, fraccion_fallos, tasa_falsos_positivos)
+                      for repeticion in range(repeticiones)]
+        if not nombres:
+            return []
+        if en_ejecutor and ejecutor is not None:
+            return [ejecutor.submit(medir_repeticion, *args) for args in argumentos]
+        return [partial(medir_repeticion, *args) for args in argumentos]
+
+    try:
+        # Sin estrategias exclusivas todas las tareas se envian desde el inicio para
+        # ocupar todos los procesos; con ellas se envia un tamaño a la vez
+        if not hay_exclusivas:
+            tareas = [enviar(n, faltantes) for n, _, faltantes in pendientes]
+
+        for posicion_n, (n, promedios, faltantes) in enumerate(pendientes):
+            if faltantes:
+                compartidas = [nombre for nombre in faltantes if nombre not in ESTRATEGIAS_EXCLUSIVAS]
+                exclusivas = [nombre for nombre in faltantes if nombre in ESTRATEGIAS_EXCLUSIVAS]
+                tareas_n = tareas[posicion_n] if not hay_exclusivas else enviar(n, compartidas)
+                # Muestras por estrategia: cada repeticion genera los mismos datos en
+                # cualquier proceso, así que se pueden juntar por nombre
+                muestras = {nombre: [] for nombre in faltantes}
+                for nombres, tareas_grupo in ((compartidas, tareas_n), (exclusivas, enviar(n, exclusivas, False))):
+                    for tarea in tareas_grupo:
+                        resultado = esperar(tarea, cancelar)
+                        if resultado is None:
+                            return
+                        for nombre, tiempos in zip(nombres, resultado):
+                            muestras[nombre].append(tiempos)
+
+                # Promediar tiempos: muestras[estrategia][repeticion] = (construccion, consulta)
+                for nombre in faltantes:
+                    promedios[nombre] = tuple(float(t) for t in np.mean(muestras[nombre], axis=0))
+                    if cache is not None:
+                        cache.guardar(clave_cache(nombre, n, repeticiones, distribucion, fraccion_fallos,
+                                                  tasa_falsos_positivos), promedios[nombre])
+                if cache is not None:
+                    cache.escribir()
+
+            yield n, {nombre: promedios[nombre] for nombre in estrategias}
+    finally:
+        if ejecutor is not None:
+            ejecutor.shutdown(wait=False, cancel_futures=True)
+
+def abrir_o_generar(ruta, n, generar):
+    # Reutiliza el archivo solo si está completo, si no lo vuelve a generar
+    if os.path.exists(ruta):
+        try:
+            datos = algoritmos.abrir_datos(ruta)
+        except ValueError:
+            datos = None
+        if datos is not None and algoritmos.datos_completos(datos, n):
+            return datos
+        del datos
+    return generar()
+
+def calcular_promedios_archivos(directorio, tamanios=TAMANIOS, repeticiones=REPETICIONES,
+                                distribucion='uniforme', semilla=None, cancelar=None):
+    # Búsqueda lineal y binaria sobre datos en disco abiertos como np.memmap.
+    # Los archivos .npy se generan una vez por tamaño y se reutilizan; la búsqueda
+    # binaria usa un archivo generado ya ordenado (distribución uniforme), así
+    # nunca se carga el arreglo completo en memoria.
+    # Produce (n, {'lineal': (0.0, consulta), 'binaria': (0.0, consulta)})
+    rng = np.random.default_rng(semilla)
+    os.makedirs(directorio, exist_ok=True)
+    for n in tamanios:
+        ruta = os.path.join(directorio, f'datos_{distribucion}_{n}.npy')
+        ruta_ordenados = os.path.join(directorio, f'ordenados_uniforme_{n}.npy')
+        datos = abrir_o_generar(ruta, n, partial(algoritmos.generar_datos_archivo, ruta, n, distribucion, rng))
+        ordenados = abrir_o_generar(ruta_ordenados, n,
+                                    partial(algoritmos.generar_datos_archivo, ruta_ordenados, n, rng=rng,
+                                            ordenado=True))
+
+        tiempos = {'lineal': [], 'binaria': []}
+        for _ in range(repeticiones):
+            if cancelar is not None and cancelar.is_set():
+                return
+
+            # Un número al azar de los datos, leyendo un solo elemento del archivo
+            x = int(datos[rng.integers(n)])
+            inicio = perf_counter()
+            algoritmos.busqueda_lineal(datos, x)
+            tiempos['lineal'].append(perf_counter() - inicio)
+
+            x = int(ordenados[rng.integers(n)])
+            inicio = perf_counter()
+            algoritmos.busqueda_binaria(ordenados, x)
+            tiempos['binaria'].append(perf_counter() - inicio)
+
+        yield n, {nombre: (0.0, float(np.mean(muestras))) for nombre, muestras in tiempos.items()}
+
+# Búsquedas en lote: nombre -> (construir, buscar_lote)
+ESTRATEGIAS_LOTE = {
+    'binaria_lote': (algoritmos.ordenar_datos, algoritmos.busqueda_binaria_lote),
+    'eytzinger_lote': (algoritmos.construir_eytzinger, algoritmos.busqueda_eytzinger_lote),
+    'pertenencia_lote': (algoritmos.construir_indice_pertenencia, algoritmos.busqueda_pertenencia_lote),
+}
+
+def calcular_promedios_lote(tamanios=TAMANIOS, consultas=1000000, repeticiones=REPETICIONES,
+                            distribucion='uniforme', semilla=None, cancelar=None):
+    # Compara la copia ordenada (np.searchsorted), el árbol Eytzinger y el índice de pertenencia respondiendo
+    # lotes de consultas aleatorias (mitad aciertos aprox.) sobre los mismos datos.
+    # Produce (n, {estrategia: (construccion, tiempo por consulta)})
+    rng = np.random.default_rng(semilla)
+    for n in tamanios:
+        tiempos = {nombre: [] for nombre in ESTRATEGIAS_LOTE}
+        for _ in range(repeticiones):
+            if cancelar is not None and cancelar.is_set():
+                return
+            datos = algoritmos.generar_datos(n, distribucion, rng)
+            claves = rng.integers(1, 2*n+1, size=consultas)
+            for nombre, (construir, buscar) in ESTRATEGIAS_LOTE.items():
+                inicio = perf_counter()
+                estructura = construir(datos)
+                construccion = perf_counter() - inicio
+                inicio = perf_counter()
+                buscar(estructura, claves)
+                tiempos[nombre].append((construccion, (perf_counter() - inicio) / consultas))
+                del estructura
+        yield n, {nombre: tuple(float(t) for t in np.mean(muestras, axis=0))
+                  for nombre, muestras in tiempos.items()}
+
+def operaciones_lista(lista, operaciones):
+    # Inserta, elimina y busca sobre una lista normal con bisect
+    for operacion, x in operaciones:
+        if operacion == 'insertar':
+            bisect.insort(lista, x)
+        else:
+            posicion = bisect.bisect_left(lista, x)
+            if operacion == 'eliminar' and posicion < len(lista) and lista[posicion] == x:
+                del lista[posicion]
+
+def operaciones_bloques(lista, operaciones):
+    # Las mismas operaciones sobre algoritmos.ListaOrdenada
+    for operacion, x in operaciones:
+        if operacion == 'insertar':
+            lista.insertar(x)
+        elif operacion == 'eliminar':
+            lista.eliminar(x)
+        else:
+            lista.buscar(x)
+
+# Estructuras ordenadas dinámicas: nombre -> (construir, aplicar operaciones)
+ESTRATEGIAS_DINAMICAS = {
+    'lista_insort': (sorted, operaciones_lista),
+    'lista_bloques': (algoritmos.ListaOrdenada, operaciones_bloques),
+}
+
+def calcular_promedios_dinamico(tamanios=TAMANIOS, operaciones=10000, repeticiones=REPETICIONES,
+                                distribucion='uniforme', semilla=None, cancelar=None):
+    # Parte de n datos y aplica una secuencia aleatoria de operaciones (mitad
+    # inserciones, un cuarto eliminaciones y un cuarto búsquedas) a una lista normal
+    # con bisect.insort y a la lista por bloques.
+    # Produce (n, {estructura: (construccion, tiempo por operacion)})
+    rng = np.random.default_rng(semilla)
+    for n in tamanios:
+        tiempos = {nombre: [] for nombre in ESTRATEGIAS_DINAMICAS}
+        for _ in range(repeticiones):
+            if cancelar is not None and cancelar.is_set():
+                return
+            datos = algoritmos.generar_datos(n, distribucion, rng).tolist()
+            tipos = rng.choice(['insertar', 'insertar', 'eliminar', 'buscar'], size=operaciones).tolist()
+            secuencia = list(zip(tipos, rng.integers(1, n+1, size=operaciones).tolist()))
+            for nombre, (construir, aplicar) in ESTRATEGIAS_DINAMICAS.items():
+                inicio = perf_counter()
+                estructura = construir(datos)
+                construccion = perf_counter() - inicio
+                inicio = perf_counter()
+                aplicar(estructura, secuencia)
+                tiempos[nombre].append((construccion, (perf_counter() - inicio) / operaciones))
+        yield n, {nombre: tuple(float(t) for t in np.mean(muestras, axis=0))
+                  for nombre, muestras in tiempos.items()}
+
+def punto_equilibrio(a, b):
+    # a y b son (construccion, consulta). Regresa el número de consultas en el que
+    # ambas estrategias cuestan lo mismo, o None si sus costos nunca se cruzan
+    diferencia_consulta = a[1] - b[1]
+    if diferencia_consulta == 0:
+        return None
+    consultas = (b[0] - a[0]) / diferencia_consulta
+    return consultas if consultas > 0 else None
+
+def equilibrios(resultados, referencia='lineal'):
+    # Punto de equilibrio de cada estrategia con construcción contra la referencia
+    # (sin construcción) de un mismo tamaño: {(referencia, b): consultas}. Antes de
+    # ese número gana la referencia, después la de menor costo por consulta.
+    # Comparar dos estrategias sin construcción no dice nada
+    if referencia not in resultados:
+        return {}
+    return {(referencia, b): punto_equilibrio(resultados[referencia], resultados[b])
+            for b in resultados if ESTRATEGIAS[b][0] is not None}
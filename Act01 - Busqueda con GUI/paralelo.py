@@ -0,0 +1,86 @@
+import math
+import multiprocessing
+import os
+from multiprocessing import shared_memory
+import numpy as np
+import algoritmos
+
+BLOQUES_POR_PROCESO = 4  # Mas bloques que procesos para repartir mejor el trabajo
+SUBBLOQUE = 1 << 16  # Elementos revisados entre cada consulta del mejor resultado
+
+# Estado de cada proceso trabajador, se asigna en iniciar_trabajador
+_memoria = None
+_datos = None
+_mejor = None
+
+
+def iniciar_trabajador(nombre, n, tipo, mejor):
+    global _memoria, _datos, _mejor
+    _memoria = shared_memory.SharedMemory(name=nombre)
+    _datos = np.ndarray((n,), dtype=tipo, buffer=_memoria.buf)
+    _mejor = mejor
+
+
+def buscar_bloque(x, inicio, fin):
+    # Primera posicion de x en [inicio, fin) o -1. El bloque se recorre por partes
+    # y se abandona en cuanto otro trabajador encontro x en una posicion anterior
+    for desde in range(inicio, fin, SUBBLOQUE):
+        if _mejor.value < desde:
+            return -1
+        posicion = algoritmos.busqueda_lineal(_datos[desde:min(desde+SUBBLOQUE, fin)], x)
+        if posicion >= 0:
+            posicion += desde
+            with _mejor.get_lock():
+                if posicion < _mejor.value:
+                    _mejor.value = posicion
+            return posicion
+    return -1
+
+
+class BuscadorParalelo:
+    # Copia los datos a memoria compartida una sola vez y mantiene un grupo de
+    # procesos que los recorren por bloques. Hay que llamar cerrar() al terminar
+    def __init__(self, datos, procesos=None):
+        datos = np.ascontiguousarray(datos)
+        self.n = len(datos)
+        self.memoria = shared_memory.SharedMemory(create=True, size=max(datos.nbytes, 1))
+        np.ndarray(datos.shape, dtype=datos.dtype, buffer=self.memoria.buf)[:] = datos
+
+        # spawn: el proceso que crea el grupo puede tener hilos (la interfaz)
+        contexto = multiprocessing.get_context('spawn')
+        procesos = procesos or os.cpu_count()
+        # Menor posicion encontrada hasta ahora, n significa que no se ha encontrado
+        self.mejor = contexto.Value('q', self.n)
+        self.grupo = contexto.Pool(procesos, initializer=iniciar_trabajador,
+                                   initargs=(self.memoria.name, self.n, datos.dtype.str, self.mejor))
+        # Esperar a que arranquen los procesos para que ese costo quede en la construccion
+        self.grupo.map(abs, range(procesos), chunksize=1)
+
+        tamanio = max(1, math.ceil(self.n / (procesos * BLOQUES_POR_PROCESO)))
+        self.rangos = [(inicio, min(inicio+tamanio, self.n)) for inicio in range(0, self.n, tamanio)]
+
+    def buscar(self, x):
+        # Los bloques se reparten en orden, asi los primeros terminan antes y los
+        # posteriores a un acierto se cancelan sin recorrerse
+        self.mejor.value = self.n
+        resultados = self.grupo.starmap(buscar_bloque, [(x, inicio, fin) for inicio, fin in self.rangos],
+                                        chunksize=1)
+        encontrados = [posicion for posicion in resultados if posicion >= 0]
+        return min(encontrados) if encontrados else -1
+
+    def cerrar(self):
+        self.grupo.terminate()
+        self.grupo.join()
+        self.memoria.close()
+        self.memoria.unlink()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+
+def busqueda_paralela(buscador, x):
+    # Primera posicion de x o -1, con la misma semantica que busqueda_lineal
+    return buscador.buscar(x)
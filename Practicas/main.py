@@ -1,59 +1,201 @@
 import math
 from random import randint
+from time import perf_counter
+import numpy as np
 import tkinter as tk
 from tkinter import messagebox
-from tkinter.messagebox import showerror
+
+UMBRAL_REJILLA = 10**4  # Desde esta cantidad de puntos se usa par_cercano_rejilla
+LIMITE_FUERZA_BRUTA = 5000  # Arriba de esto se verifica contra divide y venceras
+MUESTRA_MAXIMA = 2000  # Puntos usados para estimar el tamanio de celda
+VECINAS = ((1, -1), (1, 0), (1, 1), (0, 1))  # Mitad de las celdas vecinas, la otra mitad es simetrica
 
 
 def euclidiana(punto1, punto2):
     return math.sqrt((punto2[0]-punto1[0])**2+(punto2[1]-punto1[1])**2)
 
 
+def par_cercano_fuerza_bruta(puntos):
+    # O(n^2), se conserva para verificar el resultado de par_cercano
+    distancia_min = float("inf")
+    par = None
+    for i in range(len(puntos)):
+        for j in range(i + 1, len(puntos)):
+            distancia = euclidiana(puntos[i], puntos[j])
+            if distancia < distancia_min:
+                distancia_min = distancia
+                par = [puntos[i], puntos[j]]
+    return distancia_min, par
+
+
+def par_cercano_recursivo(por_x, inicio, fin, por_y):
+    # por_y tiene los indices de por_x[inicio:fin] ordenados por y
+    if fin - inicio <= 3:
+        return par_cercano_fuerza_bruta(por_x[inicio:fin])
+
+    medio = (inicio + fin) // 2
+    x_medio = por_x[medio][0]
+    izquierda = [i for i in por_y if i < medio]
+    derecha = [i for i in por_y if i >= medio]
+    mejor = min(par_cercano_recursivo(por_x, inicio, medio, izquierda),
+                par_cercano_recursivo(por_x, medio, fin, derecha), key=lambda resultado: resultado[0])
+
+    # Franja alrededor de la division, cada punto solo se compara con los
+    # siguientes cuya diferencia en y sea menor que la mejor distancia
+    franja = [por_x[i] for i in por_y if abs(por_x[i][0] - x_medio) < mejor[0]]
+    for i, punto1 in enumerate(franja):
+        for j in range(i+1, len(franja)):
+            punto2 = franja[j]
+            if punto2[1] - punto1[1] >= mejor[0]:
+                break
+            distancia = euclidiana(punto1, punto2)
+            if distancia < mejor[0]:
+                mejor = (distancia, [punto1, punto2])
+    return mejor
+
+
+def par_cercano(puntos):
+    # Divide y venceras O(n log n), devuelve (distancia, par)
+    if len(puntos) < 2:
+        return float("inf"), None
+    por_x = sorted(puntos)
+    por_y = sorted(range(len(por_x)), key=lambda i: por_x[i][1])
+    return par_cercano_recursivo(por_x, 0, len(por_x), por_y)
+
+
+def distancias_cuadradas(puntos, i, j):
+    diferencias = puntos[i] - puntos[j]
+    return np.einsum('ij,ij->i', diferencias, diferencias)
+
+
+def pares_en_rangos(origen, inicios, fines):
+    # Expande cada punto origen[k] con todos los indices de [inicios[k], fines[k])
+    cantidades = fines - inicios
+    i = np.repeat(origen, cantidades)
+    desplazamientos = np.arange(cantidades.sum()) - np.repeat(np.cumsum(cantidades) - cantidades, cantidades)
+    return i, np.repeat(inicios, cantidades) + desplazamientos
+
+
+def par_cercano_rejilla(puntos, rng=None):
+    # Rejilla uniforme con NumPy, trabajo esperado O(n). El lado de la celda es la
+    # distancia minima de una muestra, que es cota superior de la real: el par
+    # mas cercano siempre queda en la misma celda o en celdas vecinas.
+    # Se comparan distancias al cuadrado y solo la final pasa por la raiz
+    if len(puntos) < 2:
+        return float("inf"), None
+    rng = rng or np.random.default_rng()
+    arreglo = np.asarray(puntos, dtype=np.float64)
+    n = len(arreglo)
+
+    tamanio_muestra = min(n, max(2, math.isqrt(n)), MUESTRA_MAXIMA)
+    indices_muestra = rng.choice(n, tamanio_muestra, replace=False)
+    muestra = arreglo[indices_muestra]
+    diferencias = muestra[:, None, :] - muestra[None, :, :]
+    cuadradas = np.einsum('ijk,ijk->ij', diferencias, diferencias)
+    np.fill_diagonal(cuadradas, np.inf)
+    lado = math.sqrt(cuadradas.min())
+    if lado == 0:
+        a, b = np.unravel_index(cuadradas.argmin(), cuadradas.shape)
+        return 0.0, [tuple(puntos[int(indices_muestra[a])]), tuple(puntos[int(indices_muestra[b])])]
+
+    celdas = np.floor((arreglo - arreglo.min(axis=0)) / lado).astype(np.int64)
+    # +2 para que la fila vecina y+1 (o y-1) nunca caiga en otra columna ocupada
+    ancho = int(celdas[:, 1].max()) + 2
+    claves = celdas[:, 0] * ancho + celdas[:, 1]
+    orden = np.argsort(claves, kind='stable')
+    claves = claves[orden]
+    ordenados = arreglo[orden]
+    posiciones = np.arange(n)
+
+    # Misma celda: cada punto con los que le siguen dentro de ella
+    fines = np.searchsorted(claves, claves, side='right')
+    candidatos = [pares_en_rangos(posiciones, posiciones + 1, fines)]
+    for dx, dy in VECINAS:
+        vecinas = claves + dx * ancho + dy
+        candidatos.append(pares_en_rangos(posiciones, np.searchsorted(claves, vecinas, side='left'),
+                                          np.searchsorted(claves, vecinas, side='right')))
+
+    mejor_cuadrada, par = np.inf, None
+    for i, j in candidatos:
+        if len(i) == 0:
+            continue
+        cuadradas = distancias_cuadradas(ordenados, i, j)
+        k = cuadradas.argmin()
+        if cuadradas[k] < mejor_cuadrada:
+            mejor_cuadrada, par = cuadradas[k], (i[k], j[k])
+    # El par se devuelve con los puntos originales, no con su copia en float
+    return math.sqrt(mejor_cuadrada), [tuple(puntos[int(orden[par[0]])]), tuple(puntos[int(orden[par[1]])])]
+
+
+def motor(puntos):
+    # Divide y venceras para pocos puntos, la rejilla vectorizada para muchos
+    if len(puntos) >= UMBRAL_REJILLA:
+        return par_cercano_rejilla(puntos)
+    return par_cercano(puntos)
+
+
 def visualizador():
     puntos = []
     ventana = tk.Tk()
     punto_x = tk.IntVar()
     punto_y = tk.IntVar()
+    cantidad = tk.IntVar(value=5)
     ventana.title("Distancias minimas")
-    ventana.geometry('300x400')
+    ventana.geometry('300x500')
     tk.Label(text="Ingresa el elemento X del punto: ").pack()
     tk.Entry(ventana, textvariable=punto_x).pack()
     tk.Label(text="Ingresa el elemento Y del punto: ").pack()
     tk.Entry(ventana, textvariable=punto_y).pack()
 
     def agregar_punto():
-        if len(puntos)<5:
-            x = punto_x.get()
-            y = punto_y.get()
-            puntos.append((x, y))
-            messagebox.showinfo("Punto agregado", f"Se agregó el punto: ({x}, {y})")
-        else:
-            showerror("Error al añadir", "Solo se pueden agregar 5 puntos manuales")
-            return
+        x = punto_x.get()
+        y = punto_y.get()
+        puntos.append((x, y))
+        messagebox.showinfo("Punto agregado", f"Se agregó el punto: ({x}, {y})")
     def generar_aleatorios():
-        for i in range(5):
-            puntos.append((randint(0, 40), randint(0, 40)))
-        messagebox.showinfo("Puntos Generados", "5 Puntos aleatorios generados con exito")
+        total = cantidad.get()
+        if total <= 5:
+            for i in range(total):
+                puntos.append((randint(0, 40), randint(0, 40)))
+        else:
+            # Muchos puntos de golpe con NumPy; el rango crece para que no sean casi todos repetidos
+            limite = max(40, total)
+            puntos.extend(map(tuple, np.random.default_rng().integers(0, limite+1, (total, 2)).tolist()))
+        messagebox.showinfo("Puntos Generados", f"{total} Puntos aleatorios generados con exito")
 
     def evaluar():
         if len(puntos) < 2:
             messagebox.showerror("Error", "Debes agregar al menos 2 puntos")
             return
-        distancia_min = float("inf")
-        par_cercano = None
-
-        for i in range(len(puntos)):
-            for j in range(i + 1, len(puntos)):
-                distancia = euclidiana(puntos[i], puntos[j])
-                if distancia < distancia_min:
-                    distancia_min = distancia
-                    par_cercano = [puntos[i], puntos[j]]
-        msg_final.config(text=f"Los pares más cercanos son: {par_cercano}\n"
+        distancia_min, par = motor(puntos)
+        msg_final.config(text=f"Los pares más cercanos son: {par}\n"
                               f"con distancia minima de: {distancia_min:.3f}")
 
+    def verificar():
+        if len(puntos) < 2:
+            messagebox.showerror("Error", "Debes agregar al menos 2 puntos")
+            return
+        if len(puntos) > LIMITE_FUERZA_BRUTA:
+            nombre, referencia = "Divide y vencerás", par_cercano
+        else:
+            nombre, referencia = "Fuerza bruta", par_cercano_fuerza_bruta
+        inicio = perf_counter()
+        distancia_rapida, _ = motor(puntos)
+        medio = perf_counter()
+        distancia_referencia, _ = referencia(puntos)
+        final = perf_counter()
+        # Con empates los pares pueden diferir, la distancia no
+        coinciden = math.isclose(distancia_rapida, distancia_referencia)
+        messagebox.showinfo("Verificación", f"Motor: {medio - inicio:.6f}s\n"
+                                            f"{nombre}: {final - medio:.6f}s\n"
+                                            f"{'Coinciden' if coinciden else 'NO coinciden'}")
+
     tk.Button(ventana, text="Agregar", command=agregar_punto).pack(pady=10)
+    tk.Label(text="Cantidad de puntos aleatorios: ").pack()
+    tk.Entry(ventana, textvariable=cantidad).pack()
     tk.Button(ventana, text="Generar Aleatorios", command=generar_aleatorios).pack(pady=10)
     tk.Button(ventana, text="Ejecutar", command=evaluar).pack(pady=10)
+    tk.Button(ventana, text="Verificar", command=verificar).pack(pady=10)
     msg_final = tk.Label(ventana, text="")
     msg_final.pack(pady=10)
 
@@ -1,11 +1,37 @@
+import csv
+import json
+import math
+import queue
+import sys
+import threading
 import tkinter as tk
-from tkinter import messagebox
+from tkinter import filedialog, messagebox
 from time import perf_counter
 import tracemalloc
 from matplotlib.figure import Figure
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 
 
+PRESUPUESTO = 0.25  # Segundos maximos proyectados para una sola llamada
+VENTANA_CRECIMIENTO = 5  # Puntos recientes usados para estimar la razon de crecimiento
+RECURSIVOS = {'Recursivo', 'Dinámico'}  # Su profundidad de recursion es n
+MARGEN_RECURSION = 100  # Marcos libres para la interfaz y tracemalloc
+REPETICIONES = 3  # Corridas sin trazar por punto, se conserva la menor
+LIMITE_CONTEO_RECURSIVO = 25  # Hasta aqui se cuentan las llamadas, despues forma cerrada
+LIMITE_CONTEO_DINAMICO = 500  # Por debajo del limite de recursion
+LIMITE_FLOTANTE = 1470  # Mas alla 2F(n+1)-1 ya no cabe en un float para graficar
+N_MINIMO_GRANDE = 10**3  # Modo de enteros grandes: n de 10^3 hasta el n ingresado
+PUNTOS_POR_DECADA = 4
+PRESUPUESTO_GRANDE = 5.0  # Segundos maximos proyectados por llamada en el modo de enteros grandes
+ALGORITMOS_GRANDES = ('Iterativo', 'Duplicación rápida', 'Matricial')
+CAMPOS = ['algoritmo', 'n', 'tiempo', 'tiempo_trazado', 'sobrecarga_trazado', 'memoria_pico']
+
+# Mediciones del ultimo barrido, para exportarlas
+ultimas_filas = []
+# Ejes gemelos creados por graficar_llamadas
+ejes_secundarios = []
+
+
 def fibonacci(n) -> int:
     if n<=1:
         return n
@@ -19,6 +45,183 @@ def fibonacci_dinamico(n, dicc: dict) -> int:
         dicc[n] = (fibonacci_dinamico(n-1, dicc) + fibonacci_dinamico(n-2, dicc))
     return dicc[n]
 
+class Contador:
+    # Metricas de una ejecucion instrumentada; cada ejecucion usa su propio
+    # contador asi que no hay estado global
+    def __init__(self):
+        self.llamadas = 0
+        self.aciertos = 0
+        self.fallos = 0
+        self.profundidad_max = 0
+
+    def entrar(self, profundidad):
+        self.llamadas += 1
+        self.profundidad_max = max(self.profundidad_max, profundidad)
+
+def fibonacci_contado(n, contador, profundidad=1) -> int:
+    contador.entrar(profundidad)
+    if n<=1:
+        return n
+
+    return fibonacci_contado(n-1, contador, profundidad+1) + fibonacci_contado(n-2, contador, profundidad+1)
+
+def fibonacci_dinamico_contado(n, dicc: dict, contador, profundidad=1) -> int:
+    contador.entrar(profundidad)
+    if n <= 1:
+        return n
+    if n in dicc:
+        contador.aciertos += 1
+    else:
+        contador.fallos += 1
+        dicc[n] = (fibonacci_dinamico_contado(n-1, dicc, contador, profundidad+1) +
+                   fibonacci_dinamico_contado(n-2, dicc, contador, profundidad+1))
+    return dicc[n]
+
+def fibonacci_iterativo(n) -> int:
+    # O(n) sumas guardando solo los dos ultimos valores
+    anterior, actual = 0, 1
+    for _ in range(n):
+        anterior, actual = actual, anterior + actual
+    return anterior
+
+def fibonacci_duplicacion(n) -> int:
+    # Duplicacion rapida, O(log n) multiplicaciones recorriendo los bits de n:
+    # F(2k) = F(k)*(2F(k+1) - F(k))  y  F(2k+1) = F(k)^2 + F(k+1)^2
+    a, b = 0, 1  # F(k), F(k+1) empezando con k = 0
+    for bit in bin(n)[2:]:
+        c = a * (2*b - a)
+        d = a*a + b*b
+        if bit == '1':
+            a, b = d, c + d
+        else:
+            a, b = c, d
+    return a
+
+def multiplicar_matrices(x, y):
+    return ((x[0][0]*y[0][0] + x[0][1]*y[1][0], x[0][0]*y[0][1] + x[0][1]*y[1][1]),
+            (x[1][0]*y[0][0] + x[1][1]*y[1][0], x[1][0]*y[0][1] + x[1][1]*y[1][1]))
+
+def fibonacci_matricial(n) -> int:
+    # [[1,1],[1,0]]^n = [[F(n+1),F(n)],[F(n),F(n-1)]], potencia por cuadrados en O(log n)
+    resultado = ((1, 0), (0, 1))
+    base = ((1, 1), (1, 0))
+    while n > 0:
+        if n & 1:
+            resultado = multiplicar_matrices(resultado, base)
+        base = multiplicar_matrices(base, base)
+        n >>= 1
+    return resultado[0][1]
+
+# Algoritmos a comparar: nombre -> funcion que recibe n
+ALGORITMOS = {
+    'Recursivo': fibonacci,
+    'Dinámico': lambda n: fibonacci_dinamico(n, {}),
+    'Iterativo': fibonacci_iterativo,
+    'Duplicación rápida': fibonacci_duplicacion,
+    'Matricial': fibonacci_matricial,
+}
+
+def costo_recursivo(n):
+    # Forma cerrada: llamadas = 2F(n+1) - 1
+    return 2 * fibonacci_duplicacion(n+1) - 1
+
+def profundidad_recursiva(n):
+    # Profundidad maxima de fibonacci y fibonacci_dinamico (diccionario vacio)
+    return max(n, 1)
+
+def costo_dinamico(n):
+    # Forma cerrada con diccionario vacio: n-1 fallos (F(2)..F(n)) y n-3 aciertos
+    # (el segundo hijo de cada fallo F(k) con k >= 4), llamadas = 1 + 2*fallos
+    fallos = max(n-1, 0)
+    aciertos = max(n-3, 0)
+    return 1 + 2*fallos, aciertos, fallos
+
+def razon_crecimiento(tiempos):
+    # Media geometrica de las ultimas razones t[i]/t[i-1], nunca menor que 1
+    recientes = [t for t in tiempos[-(VENTANA_CRECIMIENTO+1):] if t > 0]
+    if len(recientes) < 2:
+        return None
+    razones = [b / a for a, b in zip(recientes, recientes[1:])]
+    return max(1.0, math.prod(razones) ** (1 / len(razones)))
+
+def regresion(us, vs):
+    # Minimos cuadrados v = ordenada + pendiente*u, regresa tambien el error
+    media_u, media_v = sum(us) / len(us), sum(vs) / len(vs)
+    varianza = sum((u - media_u)**2 for u in us)
+    pendiente = sum((u - media_u) * (v - media_v) for u, v in zip(us, vs)) / varianza if varianza else 0.0
+    ordenada = media_v - pendiente * media_u
+    return ordenada, pendiente, sum((v - ordenada - pendiente*u)**2 for u, v in zip(us, vs))
+
+def extrapolar(xs, tiempos, nuevos):
+    # Ajusta la mitad superior de los puntos medidos como exponencial (log t
+    # contra x) y como potencia (log t contra log x) y usa el de menor error;
+    # Recursivo crece como la primera y Dinámico como la segunda
+    puntos = [(x, t) for x, t in zip(xs, tiempos) if x >= xs[-1] / 2 and x > 0 and t > 0]
+    if len(puntos) < 2:
+        return [tiempos[-1]] * len(nuevos)
+    logs = [math.log(t) for _, t in puntos]
+    exponencial = regresion([x for x, _ in puntos], logs)
+    potencia = regresion([math.log(x) for x, _ in puntos], logs)
+    if exponencial[2] <= potencia[2]:
+        ordenada, pendiente, _ = exponencial
+        escala = lambda x: x
+    else:
+        ordenada, pendiente, _ = potencia
+        escala = math.log
+    # Exponente acotado para no desbordar el float
+    return [math.exp(min(ordenada + pendiente*escala(x), 700)) for x in nuevos]
+
+def barrer(xs):
+    # Mide cada algoritmo para cada valor de xs. Se deja de medir un algoritmo
+    # cuando el costo proyectado de la siguiente llamada supera PRESUPUESTO o
+    # cuando se acercaria al limite de recursion; el resto de su curva se
+    # extrapola con los ultimos puntos medidos
+    limite_recursion = sys.getrecursionlimit() - MARGEN_RECURSION
+    medidos = {nombre: [] for nombre in ALGORITMOS}
+    tiempos = {nombre: [] for nombre in ALGORITMOS}
+    memorias = {nombre: [] for nombre in ALGORITMOS}
+    extrapolados = {}
+    filas = []
+
+    for valor in xs:
+        for nombre, algoritmo in ALGORITMOS.items():
+            if nombre in extrapolados:
+                continue
+            razon = razon_crecimiento(tiempos[nombre])
+            excede = razon is not None and tiempos[nombre][-1] * razon > PRESUPUESTO
+            if excede or (nombre in RECURSIVOS and valor > limite_recursion):
+                if medidos[nombre]:
+                    x_ext = [medidos[nombre][-1]] + [x for x in xs if x >= valor]
+                    extrapolados[nombre] = (x_ext, extrapolar(medidos[nombre], tiempos[nombre], x_ext))
+                else:
+                    extrapolados[nombre] = ([], [])
+                continue
+
+            # Pasada limpia: sin trazar memoria, el menor de varios tiempos
+            limpio = float('inf')
+            for _ in range(REPETICIONES):
+                inicio = perf_counter()
+                algoritmo(valor)
+                limpio = min(limpio, perf_counter() - inicio)
+
+            # Pasada aparte con tracemalloc solo para el pico de memoria
+            tracemalloc.start()
+
+            inicio = perf_counter()
+            algoritmo(valor)
+            trazado = perf_counter() - inicio
+
+            actual, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            medidos[nombre].append(valor)
+            tiempos[nombre].append(limpio)
+            memorias[nombre].append(peak)
+            filas.append({'algoritmo': nombre, 'n': valor, 'tiempo': limpio, 'tiempo_trazado': trazado,
+                          'sobrecarga_trazado': trazado - limpio, 'memoria_pico': peak})
+
+    return medidos, tiempos, memorias, extrapolados, filas
+
 def graficar():
     try:
         n = int(entry.get())
@@ -29,64 +232,308 @@ def graficar():
         return
 
     xs = list(range(1,n+1))
-    tiempo_recursivo = []
-    tiempo_dinamico = []
-    memoria_recursiva = []
-    memoria_dinamico = []
+    medidos, tiempos, memorias, extrapolados, filas = barrer(xs)
+    ultimas_filas[:] = filas
 
-    for valor in xs:
-        # fibonaccia normal
-        tracemalloc.start()
+    quitar_ejes_secundarios()
+    ax1.clear()
+    ax1.set_title("Fibonacci temporal")
+    ax1.set_xlabel("N")
+    ax1.set_ylabel("Tiempo")
 
-        inicio = perf_counter()
-        fibonacci(valor)
-        final = perf_counter()
+    for nombre in ALGORITMOS:
+        linea, = ax1.plot(medidos[nombre], tiempos[nombre], marker='o', label=nombre)
+        if nombre in extrapolados:
+            x_ext, t_ext = extrapolados[nombre]
+            ax1.plot(x_ext, t_ext, linestyle='--', color=linea.get_color(), label=f"{nombre} (extrapolado)")
+    if extrapolados:
+        ax1.set_yscale('log')
+    ax1.legend()
+    ax1.grid(True, linestyle=':', alpha=0.6)
 
-        actual, peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
+    ax2.clear()
+    ax2.set_title("Fibonacci espacial")
+    ax2.set_xlabel("N")
+    ax2.set_ylabel("Memoria en bytes")
 
-        tiempo_recursivo.append(final - inicio)
-        memoria_recursiva.append(peak)
+    for nombre in ALGORITMOS:
+        ax2.plot(medidos[nombre], memorias[nombre], marker='o', label=nombre)
+    ax2.legend()
+    ax2.grid(True, linestyle=':', alpha=0.6)
 
-        # fibonacci con prog. dinamica
-        diccionario_dinamico = {}
+    fig.tight_layout()
 
-        tracemalloc.start()
+    canvas.draw()
 
-        inicio = perf_counter()
-        fibonacci_dinamico(valor, diccionario_dinamico)
-        final = perf_counter()
+def serie_fibonacci(n):
+    # Genera (k, F(k)) para k = 1..n en una sola pasada; cada termino reusa los
+    # dos anteriores, sin recursion ni diccionario
+    anterior, actual = 0, 1
+    for k in range(1, n+1):
+        yield k, actual
+        anterior, actual = actual, anterior + actual
 
-        actual, peak = tracemalloc.get_traced_memory()
-        tracemalloc.stop()
+def medir_serie(n):
+    # Costo acumulado y marginal de obtener cada F(k) de la serie
+    acumulados, marginales = [], []
+    inicio = previo = perf_counter()
+    for k, valor in serie_fibonacci(n):
+        ahora = perf_counter()
+        acumulados.append(ahora - inicio)
+        marginales.append(ahora - previo)
+        previo = ahora
+    return acumulados, marginales
 
-        tiempo_dinamico.append(final - inicio)
-        memoria_dinamico.append(peak)
+def graficar_serie():
+    try:
+        n = int(entry.get())
+        if n<1:
+            raise ValueError
+    except ValueError:
+        messagebox.showerror("Error", "Número no valido")
+        return
 
+    xs = list(range(1,n+1))
+    acumulados, marginales = medir_serie(n)
+
+    quitar_ejes_secundarios()
     ax1.clear()
-    ax1.set_title("Fibonacci recursivo/dinamico temporal")
+    ax1.set_title("Serie incremental: costo acumulado")
     ax1.set_xlabel("N")
     ax1.set_ylabel("Tiempo")
-
-    ax1.plot(xs, tiempo_recursivo, marker='o', label='Recursivo')
-    ax1.plot(xs, tiempo_dinamico, marker='o', label='Dinámico')
+    ax1.plot(xs, acumulados, label="Acumulado")
     ax1.legend()
     ax1.grid(True, linestyle=':', alpha=0.6)
 
     ax2.clear()
-    ax2.set_title("Fibonacci recursivo/dinamico espacial")
+    ax2.set_title("Serie incremental: costo marginal")
     ax2.set_xlabel("N")
-    ax2.set_ylabel("Memoria en bytes")
+    ax2.set_ylabel("Tiempo por término")
+    ax2.plot(xs, marginales, label="Marginal")
+    ax2.legend()
+    ax2.grid(True, linestyle=':', alpha=0.6)
+
+    fig.tight_layout()
 
-    ax2.plot(xs, memoria_recursiva, marker='o', label='Recursivo')
-    ax2.plot(xs, memoria_dinamico, marker='o', label='Dinamico')
+    canvas.draw()
+
+def muestras_logaritmicas(minimo, maximo):
+    # Valores de n espaciados uniformemente en escala logaritmica, sin repetidos
+    pasos = max(1, round(math.log10(maximo / minimo) * PUNTOS_POR_DECADA))
+    return sorted({round(minimo * (maximo / minimo) ** (i / pasos)) for i in range(pasos+1)})
+
+def barrer_grandes(xs, resultados):
+    # Corre en un hilo aparte; cada punto medido se manda a la cola para que la
+    # interfaz lo dibuje en cuanto esta listo. None marca el final
+    tiempos = {nombre: [] for nombre in ALGORITMOS_GRANDES}
+    for valor in xs:
+        for nombre in ALGORITMOS_GRANDES:
+            razon = razon_crecimiento(tiempos[nombre])
+            if razon is not None and tiempos[nombre][-1] * razon > PRESUPUESTO_GRANDE:
+                continue
+
+            inicio = perf_counter()
+            resultado = ALGORITMOS[nombre](valor)
+            final = perf_counter()
+
+            tiempos[nombre].append(final - inicio)
+            resultados.put((nombre, valor, final - inicio, (resultado.bit_length() + 7) // 8))
+    resultados.put(None)
+
+def graficar_grandes():
+    try:
+        n = int(entry.get())
+        if n<N_MINIMO_GRANDE:
+            raise ValueError
+    except ValueError:
+        messagebox.showerror("Error", f"El modo de enteros grandes necesita n >= {N_MINIMO_GRANDE}")
+        return
+
+    quitar_ejes_secundarios()
+    ax1.clear()
+    ax1.set_title("Fibonacci con enteros grandes")
+    ax1.set_xlabel("N")
+    ax1.set_ylabel("Tiempo")
+    ax1.set_xscale('log')
+    ax1.set_yscale('log')
+    ax1.grid(True, linestyle=':', alpha=0.6)
+
+    ax2.clear()
+    ax2.set_title("Tamaño del resultado")
+    ax2.set_xlabel("N")
+    ax2.set_ylabel("Bytes")
+    ax2.set_xscale('log')
+    ax2.set_yscale('log')
+    ax2.grid(True, linestyle=':', alpha=0.6)
+
+    puntos = {nombre: ([], [], []) for nombre in ALGORITMOS_GRANDES}
+    lineas = {nombre: ax1.plot([], [], marker='o', label=nombre)[0] for nombre in ALGORITMOS_GRANDES}
+    linea_bytes, = ax2.plot([], [], marker='o', label="F(n)")
+    ax1.legend()
     ax2.legend()
+
+    resultados = queue.Queue()
+    threading.Thread(target=barrer_grandes, args=(muestras_logaritmicas(N_MINIMO_GRANDE, n), resultados),
+                     daemon=True).start()
+    btn_grandes.config(state="disabled")
+
+    def revisar():
+        terminado = False
+        while True:
+            try:
+                punto = resultados.get_nowait()
+            except queue.Empty:
+                break
+            if punto is None:
+                terminado = True
+                break
+            nombre, valor, tiempo, tamanio = punto
+            xs, tiempos, tamanios = puntos[nombre]
+            xs.append(valor)
+            tiempos.append(tiempo)
+            tamanios.append(tamanio)
+            lineas[nombre].set_data(xs, tiempos)
+            # El tamanio no depende del algoritmo, se toma de la serie mas larga
+            mayor = max(puntos.values(), key=lambda serie: len(serie[0]))
+            linea_bytes.set_data(mayor[0], mayor[2])
+
+        for eje in (ax1, ax2):
+            eje.relim()
+            eje.autoscale_view()
+        fig.tight_layout()
+        canvas.draw_idle()
+
+        if terminado:
+            btn_grandes.config(state="normal")
+        else:
+            ventana.after(100, revisar)
+
+    ventana.after(100, revisar)
+
+def tiempo_minimo(algoritmo, valor):
+    mejor = float('inf')
+    for _ in range(REPETICIONES):
+        inicio = perf_counter()
+        algoritmo(valor)
+        mejor = min(mejor, perf_counter() - inicio)
+    return mejor
+
+def quitar_ejes_secundarios():
+    # Los ejes gemelos de graficar_llamadas no se borran con ax1.clear()
+    for eje in ejes_secundarios:
+        eje.remove()
+    ejes_secundarios.clear()
+
+def graficar_llamadas():
+    # Metricas deterministas de costo junto al tiempo medido: se cuentan
+    # mientras es barato y el resto del rango sale de la forma cerrada
+    try:
+        n = int(entry.get())
+        if n<1:
+            raise ValueError
+    except ValueError:
+        messagebox.showerror("Error", "Número no valido")
+        return
+
+    xs = list(range(1,n+1))
+    contados_rec = [x for x in xs if x <= LIMITE_CONTEO_RECURSIVO]
+    contados_din = [x for x in xs if x <= LIMITE_CONTEO_DINAMICO]
+    llamadas_rec, llamadas_din, aciertos_din, fallos_din, prof_rec, prof_din = [], [], [], [], [], []
+    tiempos_rec, tiempos_din = [], []
+    for x in contados_rec:
+        contador = Contador()
+        fibonacci_contado(x, contador)
+        llamadas_rec.append(contador.llamadas)
+        prof_rec.append(contador.profundidad_max)
+        tiempos_rec.append(tiempo_minimo(fibonacci, x))
+    for x in contados_din:
+        contador = Contador()
+        fibonacci_dinamico_contado(x, {}, contador)
+        llamadas_din.append(contador.llamadas)
+        aciertos_din.append(contador.aciertos)
+        fallos_din.append(contador.fallos)
+        prof_din.append(contador.profundidad_max)
+        tiempos_din.append(tiempo_minimo(ALGORITMOS['Dinámico'], x))
+
+    # 2F(x+1)-1 para todo el rango en una sola pasada de la serie
+    cerrados_rec = [x for x in xs if x <= LIMITE_FLOTANTE]
+    llamadas_cerradas_rec = [2*valor - 1 for k, valor in serie_fibonacci(len(cerrados_rec)+1) if k >= 2]
+
+    quitar_ejes_secundarios()
+    ax1.clear()
+    ax1.set_title("Tiempo y llamadas")
+    ax1.set_xlabel("N")
+    ax1.set_ylabel("Tiempo")
+    ax1.set_yscale('log')
+    ax1.plot(contados_rec, tiempos_rec, marker='o', label="Recursivo (tiempo)")
+    ax1.plot(contados_din, tiempos_din, marker='o', markersize=3, label="Dinámico (tiempo)")
+    ax1.grid(True, linestyle=':', alpha=0.6)
+
+    llamadas = ax1.twinx()
+    ejes_secundarios.append(llamadas)
+    llamadas.set_ylabel("Llamadas")
+    llamadas.set_yscale('log')
+    llamadas.plot(cerrados_rec, llamadas_cerradas_rec, 'k--', label="Recursivo 2F(n+1)-1")
+    llamadas.plot(contados_rec, llamadas_rec, 'kx', label="Recursivo (contado)")
+    llamadas.plot(xs, [costo_dinamico(x)[0] for x in xs], 'k:', label="Dinámico 2n-1")
+    llamadas.plot(contados_din, llamadas_din, 'k+', markersize=3, label="Dinámico (contado)")
+    lineas_tiempo, etiquetas_tiempo = ax1.get_legend_handles_labels()
+    lineas_llamadas, etiquetas_llamadas = llamadas.get_legend_handles_labels()
+    ax1.legend(lineas_tiempo + lineas_llamadas, etiquetas_tiempo + etiquetas_llamadas, fontsize='small')
+
+    ax2.clear()
+    ax2.set_title("Profundidad y memoria de Dinámico")
+    ax2.set_xlabel("N")
+    ax2.set_ylabel("Cantidad")
+    ax2.plot(xs, [profundidad_recursiva(x) for x in xs], label="Profundidad (forma cerrada)")
+    ax2.plot(contados_rec, prof_rec, 'o', label="Profundidad Recursivo (contada)")
+    ax2.plot(contados_din, prof_din, 'x', markersize=3, label="Profundidad Dinámico (contada)")
+    ax2.plot(contados_din, aciertos_din, ':', label="Dinámico aciertos")
+    ax2.plot(contados_din, fallos_din, '--', label="Dinámico fallos")
+    ax2.axhline(sys.getrecursionlimit(), color='red', linestyle='--', label="Límite de recursión")
+    ax2.legend(fontsize='small')
     ax2.grid(True, linestyle=':', alpha=0.6)
 
     fig.tight_layout()
 
     canvas.draw()
 
+def exportar():
+    if not ultimas_filas:
+        messagebox.showerror("Error", "Primero hay que graficar")
+        return
+    salida = filedialog.asksaveasfilename(defaultextension=".csv",
+                                          filetypes=[("CSV", "*.csv"), ("JSON", "*.json")])
+    if not salida:
+        return
+
+    if salida.endswith('.json'):
+        with open(salida, 'w', encoding='utf-8') as archivo:
+            json.dump(ultimas_filas, archivo, indent=1)
+    else:
+        with open(salida, 'w', newline='', encoding='utf-8') as archivo:
+            escritor = csv.DictWriter(archivo, fieldnames=CAMPOS)
+            escritor.writeheader()
+            escritor.writerows(ultimas_filas)
+
+def calcular_n():
+    # Un solo F(n) con duplicacion rapida, sirve para n en los millones
+    try:
+        n = int(entry.get())
+        if n<1:
+            raise ValueError
+    except ValueError:
+        messagebox.showerror("Error", "Número no valido")
+        return
+
+    inicio = perf_counter()
+    valor = fibonacci_duplicacion(n)
+    final = perf_counter()
+
+    digitos = int(valor.bit_length() * math.log10(2)) + 1
+    messagebox.showinfo("Resultado", f"F({n}) tiene aprox. {digitos} dígitos\n"
+                                     f"Calculado en {final - inicio:.6f}s con duplicación rápida")
+
 ventana = tk.Tk()
 ventana.title("Análisis de Algoritmos Fibonacci")
 # ventana.geometry("1000x600")
@@ -101,6 +548,21 @@ entry.pack(side="left", padx=5)
 btn = tk.Button(control_frame, text="Graficar", command=graficar)
 btn.pack(side="left", padx=10)
 
+btn_serie = tk.Button(control_frame, text="Serie incremental", command=graficar_serie)
+btn_serie.pack(side="left", padx=10)
+
+btn_llamadas = tk.Button(control_frame, text="Contar llamadas", command=graficar_llamadas)
+btn_llamadas.pack(side="left", padx=10)
+
+btn_grandes = tk.Button(control_frame, text="Enteros grandes", command=graficar_grandes)
+btn_grandes.pack(side="left", padx=10)
+
+btn_n = tk.Button(control_frame, text="Calcular F(n)", command=calcular_n)
+btn_n.pack(side="left", padx=10)
+
+btn_exportar = tk.Button(control_frame, text="Exportar", command=exportar)
+btn_exportar.pack(side="left", padx=10)
+
 fig = Figure(figsize=(10, 5), dpi=100)
 ax1, ax2 = fig.subplots(1, 2)
 